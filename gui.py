@@ -3,6 +3,7 @@ GUI 모듈 - 테이블 이미지와 판정결과 텍스트 표시 기능 및 스
 """
 import tkinter as tk
 from tkinter import filedialog, messagebox, scrolledtext, ttk
+from tkinter import font as tkfont
 
 import fitz
 from pdf_to_json import enhanced_pdf_to_json
@@ -13,11 +14,16 @@ import sys
 import threading
 import time
 import re
-import base64
+import math
+import binascii
 from io import BytesIO
 import hashlib
 import tempfile
 import copy
+from bisect import bisect_right
+from collections import ChainMap, Counter, OrderedDict
+from functools import lru_cache
+from types import SimpleNamespace
 
 import pdf2image
 from PIL import Image
@@ -41,6 +47,258 @@ try:
 except ImportError as e:
     print(f"모듈 임포트 오류: {e}")
 
+# 반복 호출되는 정규식은 모듈 로드 시 한 번만 컴파일
+_TE_RE = re.compile(r'^TE\d+(?:\.\d+)+$')
+_TE_EXTRACT_RE = re.compile(r'TE\d+\.\d+\.\d+')
+_JUDGMENT_RE = re.compile(r'판정\s*근거', re.IGNORECASE)
+_SECTION_RE = re.compile(r'^\d+\.\d+\.\d+\s+')
+_FIGURE_RE = re.compile(r'figure', re.IGNORECASE)
+# 판정근거 표 이미지 키워드 ('시험결과판정근거', 'result table'은 각각 '판정근거', 'table'에 포함됨)
+_JUDGMENT_KEYWORD_RE = re.compile(r'판정근거|judgment|table')
+_PREFERRED_EXT_RE = re.compile(r'\.(?:png|jpg|jpeg)$', re.MULTILINE)
+
+# 시험결과판정근거 표 이미지 파일명의 접미사 (유연하게 매칭)
+_TABLE_IMAGE_SUFFIX = r'(시험\s*결과\s*[_]*\s*판정\s*[_]*\s*근거|시험결과[_]*판정[_]*근거)'
+
+# 이미지로 간주할 데이터 키 (앞쪽부터 검사하여 첫 값에서 바로 판정)
+_IMG_SOURCE_KEYS = ('base64', 'file_path', 'image_data', 'src', 'url')
+_IMG_DATA_KEYS = _IMG_SOURCE_KEYS + ('caption', 'image_id')
+
+# Figure 데이터로 옮겨 담는 이미지 원본 필드
+_FIGURE_DATA_FIELDS = (
+    'base64', 'file_path', 'src', 'url', 'path', 'filename',
+    'image_data', 'data', 'content', 'binary_data'
+)
+
+# 이미지에서 TE 번호를 찾을 때 살펴보는 속성
+_SEARCH_FIELDS = (
+    'caption', 'file_path', 'image_id', 'src', 'url', 'alt', 'title',
+    'description', 'name', 'filename', 'path', 'table_caption', 'table_id'
+)
+
+@lru_cache(maxsize=256)
+def _te_variants(te_number):
+    """
+    TE 번호의 표기 변형(., _, -)을 TE 번호별로 한 번만 만든다. 반복 비교되므로 인터닝해 둔다.
+    
+    Args:
+        te_number (str): TE 번호 (예: "TE02.03.01")
+    
+    Returns:
+        tuple: (TE02.03.01, TE02_03_01, TE02-03-01) 형태의 튜플
+    """
+    return tuple(sys.intern(te) for te in
+                 (te_number, te_number.replace('.', '_'), te_number.replace('.', '-')))
+
+@lru_cache(maxsize=256)
+def _te_filename_variants(te_number):
+    """
+    파일명 매칭에 쓰는 소문자 TE 번호 변형을 TE 번호별로 한 번만 만든다.
+    
+    Args:
+        te_number (str): TE 번호
+    
+    Returns:
+        tuple: 소문자 TE 변형 튜플 (., _, - 표기와 'te' 제거 후 _ 표기), TE 번호가 없으면 빈 튜플
+    """
+    if not te_number:
+        return ()
+    return (
+        te_number.lower(),
+        te_number.replace('.', '_').lower(),
+        te_number.replace('.', '-').lower(),
+        te_number.replace('te', '').replace('.', '_').lower()
+    )
+
+@lru_cache(maxsize=256)
+def _te_any_re(te_number):
+    """
+    TE 번호의 표기 변형(., _, -) 중 하나라도 포함되는지 한 번의 검색으로 확인하는 정규식을 만든다.
+    
+    Args:
+        te_number (str): TE 번호
+    
+    Returns:
+        re.Pattern: 컴파일된 정규식
+    """
+    return re.compile('|'.join(re.escape(te) for te in _te_variants(te_number)))
+
+def _find_segments(pattern, texts):
+    """
+    패턴이 등장하는 텍스트의 인덱스 목록을 반환한다.
+    
+    텍스트마다 search를 호출하지 않고 NUL로 이어 붙인 하나의 버퍼를 한 번 훑는다.
+    패턴은 NUL을 포함하지 않는다고 가정하므로 매칭이 텍스트 경계를 넘지 않으며,
+    한 텍스트에서 매칭되면 다음 텍스트 시작 위치부터 다시 찾는다.
+    
+    Args:
+        pattern (re.Pattern): 컴파일된 정규식
+        texts (list): 문자열 목록 (None은 빈 문자열로 취급)
+    
+    Returns:
+        list: 매칭된 텍스트 인덱스 목록 (오름차순)
+    """
+    starts = []
+    offset = 0
+    for text in texts:
+        starts.append(offset)
+        offset += len(text or "") + 1
+    starts.append(offset)
+    
+    joined = "\x00".join([text or "" for text in texts])
+    found = []
+    pos = 0
+    while True:
+        match = pattern.search(joined, pos)
+        if not match:
+            return found
+        idx = bisect_right(starts, match.start()) - 1
+        found.append(idx)
+        pos = starts[idx + 1]
+
+def _as_text(value):
+    """
+    JSON 값을 문자열로 변환한다. 이미 문자열이면 그대로 반환하고, 거짓 값은 빈 문자열로 취급한다.
+    
+    Args:
+        value: JSON에서 읽은 값
+    
+    Returns:
+        str: 문자열 값
+    """
+    if isinstance(value, str):
+        return value
+    return str(value or "")
+
+def _iter_cell_texts(cells):
+    """
+    표 셀 중 'text' 키가 있는 셀의 텍스트를 문자열로 차례로 반환한다.
+    
+    Args:
+        cells (list): 표 셀 목록
+    
+    Yields:
+        str: 셀 텍스트
+    """
+    for cell in cells:
+        if cell and 'text' in cell:
+            yield _as_text(cell.get("text"))
+
+def _try_open_image(path):
+    """
+    경로의 이미지를 연다. os.path.exists 확인 없이 바로 열어 stat 호출을 줄인다.
+    
+    Args:
+        path (str): 이미지 파일 경로
+    
+    Returns:
+        PIL.Image.Image or None: 열린 이미지, 열 수 없으면 None
+    """
+    try:
+        return Image.open(path)
+    except OSError:
+        return None
+
+def _open_base64_image(base64_data):
+    """
+    base64 문자열(data URI 형식 포함)을 디코딩하여 이미지를 연다.
+    
+    'data:image/...;base64,' 접두어는 split으로 나누지 않고 위치만 찾아 건너뛰며,
+    ASCII로 인코딩한 바이트를 memoryview로 잘라 바로 디코딩한다.
+    (split 결과 리스트와 잘라낸 페이로드 문자열은 만들지 않지만, encode 시 한 번은 복사된다)
+    
+    Args:
+        base64_data (str): base64 문자열
+    
+    Returns:
+        PIL.Image.Image: 열린 이미지
+    """
+    encoded = base64_data.encode('ascii')
+    start = encoded.find(b',') + 1 if encoded.startswith(b'data:image') else 0
+    return Image.open(BytesIO(binascii.a2b_base64(memoryview(encoded)[start:])))
+
+# reportlab 모듈 묶음 (PDF 저장 시 처음 한 번만 import)
+_pdf_mods = None
+
+def _load_pdf_modules():
+    """
+    PDF 저장에 필요한 reportlab 모듈을 처음 호출 시에만 import하여 캐시한다.
+    
+    Returns:
+        SimpleNamespace: reportlab 클래스/상수 묶음
+    """
+    global _pdf_mods
+    if _pdf_mods is None:
+        from reportlab.lib.pagesizes import A4
+        from reportlab.lib.units import cm
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        _pdf_mods = SimpleNamespace(
+            A4=A4, cm=cm, pdfmetrics=pdfmetrics, TTFont=TTFont,
+            getSampleStyleSheet=getSampleStyleSheet, ParagraphStyle=ParagraphStyle,
+            SimpleDocTemplate=SimpleDocTemplate, Paragraph=Paragraph, Spacer=Spacer
+        )
+    return _pdf_mods
+
+# 지원되는 이미지 확장자
+_IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif')
+
+# 폴더 경로 -> (폴더 mtime, [(파일명, 소문자 파일명), ...])
+_image_folder_cache = {}
+
+# 이미지 뷰어 확대/축소 결과 캐시 한도 (항목 수, 전체 픽셀 수)
+_ZOOM_CACHE_SIZE = 16
+_ZOOM_CACHE_MAX_PIXELS = 32_000_000
+# 이미지 뷰어 줌 레벨은 _ZOOM_STEP ** n 격자에만 두어 같은 단계의 렌더링 결과를 재사용 (0.1x ~ 5.0x 범위 안)
+_ZOOM_STEP = 1.1
+_ZOOM_MIN_STEP = math.ceil(math.log(0.1, _ZOOM_STEP))
+_ZOOM_MAX_STEP = math.floor(math.log(5.0, _ZOOM_STEP))
+# 확대/축소 조작이 멈춘 뒤 LANCZOS로 다시 그리기까지의 대기 시간 (ms)
+_ZOOM_HQ_DELAY_MS = 120
+# 연속된 마우스 휠 입력을 한 번의 확대/축소로 모으는 간격 (ms, 약 60Hz)
+_ZOOM_WHEEL_FLUSH_MS = 16
+
+def _zoom_step(zoom_level):
+    """
+    줌 레벨에 가장 가까운 _ZOOM_STEP ** n 격자 단계를 허용 범위로 제한해 반환
+    
+    Args:
+        zoom_level (float): 줌 레벨
+    
+    Returns:
+        int: 격자 단계 n
+    """
+    return max(_ZOOM_MIN_STEP, min(_ZOOM_MAX_STEP, round(math.log(zoom_level, _ZOOM_STEP))))
+
+def _scan_image_folder(image_folder):
+    """
+    이미지 폴더의 파일 목록을 반환한다. 폴더 mtime이 바뀌지 않았으면 캐시를 재사용한다.
+    
+    Args:
+        image_folder (str): 이미지 폴더 경로
+    
+    Returns:
+        list: (파일명, 소문자 파일명) 튜플 목록
+    
+    Raises:
+        OSError: 폴더를 읽을 수 없는 경우
+    """
+    mtime = os.stat(image_folder).st_mtime
+    cached = _image_folder_cache.get(image_folder)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    entries = []
+    with os.scandir(image_folder) as it:
+        for entry in it:
+            name_lower = entry.name.lower()
+            if name_lower.endswith(_IMAGE_EXTENSIONS) and entry.is_file():
+                entries.append((entry.name, name_lower))
+    _image_folder_cache[image_folder] = (mtime, entries)
+    return entries
+
 # TableImagePopup 클래스 정의 - 이미지와 텍스트를 함께 표시
 class TableImagePopup:
     """테이블 이미지와 판정결과 텍스트를 함께 표시하는 팝업 창"""
@@ -1374,8 +1632,8 @@ class TableImagePopup:
             return {}
 
         try:
-            all_files = [f for f in os.listdir(output_dir) 
-                        if any(f.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.bmp', '.gif'])]
+            # str.endswith는 튜플을 받으므로 확장자별 반복 없이 한 번에 검사
+            all_files = [f for f in os.listdir(output_dir) if f.lower().endswith(_IMAGE_EXTENSIONS)]
         except Exception as e:
             if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
                 print(f"폴더 읽기 오류: {output_dir}, 오류: {str(e)}")
@@ -1853,14 +2111,7 @@ class TableImagePopup:
         # 2. 로컬 이미지가 없으면 JSON base64 데이터 사용 (fallback)
         if not image_loaded and figure.get('base64'):
             try:
-                base64_data = figure['base64']
-                if base64_data.startswith('data:image'):
-                    base64_parts = base64_data.split(',', 1)
-                    if len(base64_parts) > 1:
-                        base64_data = base64_parts[1]
-                
-                image_bytes = base64.b64decode(base64_data)
-                image = Image.open(BytesIO(image_bytes))
+                image = _open_base64_image(figure['base64'])
                 
                 # 확대/축소 비율 적용
                 base_zoom = getattr(self, 'zoom_factor', 1.0)
@@ -1910,30 +2161,28 @@ class TableImagePopup:
         Returns:
             str: 파일 경로 또는 None
         """
+        # 디버그 여부는 한 번만 확인하여 파일별 점수 계산에도 전달
+        debug = hasattr(self.validator, 'debug_mode') and self.validator.debug_mode
         try:
             # extracted_images 폴더 경로 설정
             current_dir = os.path.dirname(os.path.abspath(__file__))
             image_folder = os.path.join(current_dir, "extracted_images")
             
             if not os.path.exists(image_folder):
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                if debug:
                     print(f"extracted_images 폴더가 존재하지 않음: {image_folder}")
                 return None
             
-            # 지원되는 이미지 확장자
-            supported_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif']
-            
-            # 폴더 내 파일 목록 가져오기
+            # 폴더 내 파일 목록 가져오기 (scandir 결과를 폴더 mtime 기준으로 캐시)
             try:
-                all_files = [f for f in os.listdir(image_folder) 
-                           if any(f.lower().endswith(ext) for ext in supported_extensions)]
+                all_files = [file_name for file_name, _ in _scan_image_folder(image_folder)]
             except Exception as e:
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                if debug:
                     print(f"폴더 읽기 오류: {image_folder}, 오류: {str(e)}")
                 return None
             
             if not all_files:
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                if debug:
                     print(f"extracted_images 폴더에 이미지 파일이 없음: {image_folder}")
                 return None
             
@@ -1942,30 +2191,33 @@ class TableImagePopup:
             page_num = figure.get('page', 'Unknown')
             te_number = getattr(self, 'te_number', '')
             
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+            if debug:
                 print(f"Figure 검색 정보: 캡션='{caption}', 페이지={page_num}, TE={te_number}")
                 print(f"사용 가능한 파일: {all_files[:5]}...")  # 처음 5개만 표시
             
+            # 파일마다 다시 만들지 않도록 TE 변형은 한 번만 생성
+            te_variants = _te_filename_variants(te_number)
+            
             # 1단계: 캡션 기반 정확한 매칭
             best_match = None
             best_score = 0
             
             for file_name in all_files:
-                score = self._calculate_figure_match_score(file_name, caption, page_num, te_number, figure_idx)
+                score = self._calculate_figure_match_score(file_name, caption, page_num, te_variants, figure_idx, debug)
                 
                 if score > best_score:
                     best_score = score
                     best_match = file_name
                     
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode and score > 0:
+                if debug and score > 0:
                     print(f"  파일 매칭: {file_name} -> 점수: {score}")
             
+            # 목록의 파일은 scandir로 확인된 것이므로 os.path.exists 재확인 없이 경로를 반환
+            # (파일이 그 사이 사라졌다면 이미지를 여는 단계에서 처리됨)
             if best_match and best_score > 30:  # 임계값 설정
-                matched_path = os.path.join(image_folder, best_match)
-                if os.path.exists(matched_path):
-                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                        print(f"✅ Figure 이미지 매칭 성공: {best_match} (점수: {best_score})")
-                    return matched_path
+                if debug:
+                    print(f"✅ Figure 이미지 매칭 성공: {best_match} (점수: {best_score})")
+                return os.path.join(image_folder, best_match)
             
             # 2단계: Figure 패턴 기반 순서 매칭
             figure_files = [f for f in all_files if 'figure' in f.lower() or 'fig' in f.lower()]
@@ -1973,25 +2225,23 @@ class TableImagePopup:
             
             if figure_idx < len(figure_files):
                 fallback_file = figure_files[figure_idx]
-                fallback_path = os.path.join(image_folder, fallback_file)
-                if os.path.exists(fallback_path):
-                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                        print(f"✅ Figure 이미지 순서 매칭: {fallback_file} (인덱스: {figure_idx})")
-                    return fallback_path
+                if debug:
+                    print(f"✅ Figure 이미지 순서 매칭: {fallback_file} (인덱스: {figure_idx})")
+                return os.path.join(image_folder, fallback_file)
             
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+            if debug:
                 print(f"❌ Figure 이미지 매칭 실패: 적절한 파일을 찾을 수 없음")
             
             return None
             
         except Exception as e:
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+            if debug:
                 print(f"로컬 Figure 이미지 검색 중 오류: {str(e)}")
                 import traceback
                 traceback.print_exc()
             return None
 
-    def _calculate_figure_match_score(self, filename, caption, page_num, te_number, figure_idx):
+    def _calculate_figure_match_score(self, filename, caption, page_num, te_variants, figure_idx, debug=False):
         """
         파일명과 Figure 정보 간의 매칭 점수를 계산
         
@@ -1999,8 +2249,9 @@ class TableImagePopup:
             filename (str): 파일명
             caption (str): Figure 캡션
             page_num (str/int): 페이지 번호
-            te_number (str): TE 번호
+            te_variants (tuple): 소문자 TE 번호 변형 목록 (호출 측에서 한 번만 생성)
             figure_idx (int): Figure 인덱스
+            debug (bool): 매칭 항목별 로그 출력 여부
             
         Returns:
             int: 매칭 점수 (높을수록 좋은 매칭)
@@ -2010,27 +2261,19 @@ class TableImagePopup:
         caption_lower = caption.lower() if caption else ''
         
         # 1. TE 번호 매칭 (최고 우선순위)
-        if te_number:
-            te_variants = [
-                te_number.lower(),
-                te_number.replace('.', '_').lower(),
-                te_number.replace('.', '-').lower(),
-                te_number.replace('te', '').replace('.', '_').lower()
-            ]
-            
-            for te_variant in te_variants:
-                if te_variant in filename_lower:
-                    score += 100
-                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                        print(f"    TE 번호 매칭: {te_variant} in {filename_lower} (+100)")
-                    break
+        for te_variant in te_variants:
+            if te_variant in filename_lower:
+                score += 100
+                if debug:
+                    print(f"    TE 번호 매칭: {te_variant} in {filename_lower} (+100)")
+                break
         
         # 2. Figure 키워드 매칭
         figure_keywords = ['figure', 'fig']
         for keyword in figure_keywords:
             if keyword in filename_lower and keyword in caption_lower:
                 score += 80
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                if debug:
                     print(f"    Figure 키워드 매칭: {keyword} (+80)")
                 break
         
@@ -2046,7 +2289,7 @@ class TableImagePopup:
             for pattern in page_patterns:
                 if pattern in filename_lower:
                     score += 60
-                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                    if debug:
                         print(f"    페이지 번호 매칭: {pattern} (+60)")
                     break
         
@@ -2064,7 +2307,7 @@ class TableImagePopup:
             for pattern in fig_patterns:
                 if pattern in filename_lower:
                     score += 90
-                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                    if debug:
                         print(f"    Figure 번호 매칭: {pattern} (+90)")
                     break
         
@@ -2079,7 +2322,7 @@ class TableImagePopup:
         for pattern in index_patterns:
             if pattern in filename_lower:
                 score += 40
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                if debug:
                     print(f"    인덱스 매칭: {pattern} (+40)")
                 break
         
@@ -2088,7 +2331,7 @@ class TableImagePopup:
         for keyword in common_keywords:
             if keyword in filename_lower and ('figure' in caption_lower or 'fig' in caption_lower):
                 score += 20
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                if debug:
                     print(f"    일반 키워드 매칭: {keyword} (+20)")
                 break
         
@@ -2176,27 +2419,12 @@ class TableImagePopup:
                 image = image_data
             elif isinstance(image_data, dict):
                 if 'base64' in image_data and image_data['base64']:
-                    base64_data = image_data['base64']
-                    if base64_data.startswith('data:image'):
-                        base64_parts = base64_data.split(',', 1)
-                        if len(base64_parts) > 1:
-                            base64_data = base64_parts[1]
-                    image_bytes = base64.b64decode(base64_data)
-                    image = Image.open(BytesIO(image_bytes))
-                elif 'file_path' in image_data and image_data['file_path']:
-                    file_path = image_data['file_path']
-                    if os.path.exists(file_path):
-                        image = Image.open(file_path)
-                elif 'src' in image_data and image_data['src']:
-                    src = image_data['src']
-                    if os.path.exists(src):
-                        image = Image.open(src)
-                elif 'url' in image_data and image_data['url']:
-                    url = image_data['url']
-                    if os.path.exists(url):
-                        image = Image.open(url)
+                    image = _open_base64_image(image_data['base64'])
                 else:
-                    raise ValueError("이미지 데이터가 없습니다.")
+                    path = image_data.get('file_path') or image_data.get('src') or image_data.get('url')
+                    if not path:
+                        raise ValueError("이미지 데이터가 없습니다.")
+                    image = _try_open_image(path)
             else:
                 raise ValueError("지원되지 않는 이미지 데이터 형식입니다.")
             
@@ -2283,6 +2511,12 @@ class TableImagePopup:
 
         
 class JSONValidatorGUI:
+    # 결과 버튼 영역 위젯 스타일 (폰트는 _create_result_widgets에서 공유 Font 객체로 생성)
+    _LABEL_HDR_KW = {"bg": "#f5f5f5"}
+    _MAIN_BTN_KW = {"bg": "#d4edda", "fg": "#155724", "relief": tk.RAISED, "padx": 10, "pady": 5, "anchor": tk.W}
+    _SUB_BTN_KW = {"bg": "#e6f2ff", "fg": "#0056b3", "relief": tk.RAISED, "padx": 8, "pady": 4, "bd": 1}
+    _IMG_BTN_KW = {"bg": "#e6e6ff", "padx": 5, "pady": 2, "wraplength": 200, "justify": tk.LEFT}
+
     def __init__(self, root):
         """
         GUI 인터페이스 초기화
@@ -2297,11 +2531,30 @@ class JSONValidatorGUI:
         
         self.is_validating = False
         self.validation_completed = False
-        self.stop_progress_animation = False
+        self.stop_progress_animation = threading.Event()
         
         self.found_paths = {}
         self.table_paths = []
         self.test_contents = {}
+        self.te_numbers = []
+        self.te_groups = {}
+        self.te_group_counts = {}
+        self._page_te_counts = {}
+        self._page_first_te_set = {}
+        self._page_joined = None
+        self._te_variants = []
+        self._te_canonical = {}
+        self._te_variants_re = None
+        self._te_variants_page_re = None
+        self._te_lookup_key = None
+        self._page_te_counts_key = None
+        self._scrollregion_pending = False
+        self._image_id_cache = {}
+        self._table_image_re_cache = {}
+        self._test_result_images = None
+        self._test_result_identifier_set = set()
+        self.accordion_states = {}
+        self._accordion_pool = []
         
         try:
             self.validator = JSONValidator()
@@ -2311,6 +2564,21 @@ class JSONValidatorGUI:
             return
         
         self._create_widgets()
+        
+        # 첫 이미지 팝업이 폴더 스캔을 기다리지 않도록 이미지 폴더 목록을 미리 캐시
+        threading.Thread(target=self._prewarm_image_folders, daemon=True).start()
+    
+    def _prewarm_image_folders(self):
+        """
+        extracted_images / extracted_table_images 폴더 목록을 백그라운드에서 미리 읽어 캐시
+        """
+        current_dir = os.path.dirname(os.path.abspath(__file__))
+        for folder_name in ("extracted_images", "extracted_table_images"):
+            try:
+                _scan_image_folder(os.path.join(current_dir, folder_name))
+            except OSError:
+                # 폴더가 없거나 읽을 수 없으면 실제 검색 시점에 다시 처리
+                pass
     
     def _create_widgets(self):
         """GUI 요소를 생성하고 배치"""
@@ -2474,6 +2742,16 @@ class JSONValidatorGUI:
         self.buttons_canvas.bind("<Button-4>", self._on_mousewheel_horizontal)
         self.buttons_canvas.bind("<Button-5>", self._on_mousewheel_horizontal)
         
+        # 결과 버튼에 공통으로 쓰는 폰트 (Tk가 글꼴 메트릭을 한 번만 계산하도록 공유)
+        self._font_header = tkfont.Font(family="Arial", size=10, weight="bold")
+        self._font_main_btn = tkfont.Font(family="Arial", size=9, weight="bold")
+        self._font_sub_btn = tkfont.Font(family="Arial", size=8)
+        self._font_img_btn = tkfont.Font(family="Arial", size=9)
+        
+        # 아코디언 하위 버튼의 hover 효과는 클래스 바인딩 하나로 모든 버튼에 공유
+        self.root.bind_class("AccordionSubBtn", "<Enter>", lambda e: e.widget.config(bg="#cce7ff"))
+        self.root.bind_class("AccordionSubBtn", "<Leave>", lambda e: e.widget.config(bg="#e6f2ff"))
+        
         self.found_text = scrolledtext.ScrolledText(left_frame, wrap=tk.WORD, bg="#f5f5f5")
         self.found_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
@@ -2483,6 +2761,12 @@ class JSONValidatorGUI:
         tk.Label(right_frame, text="누락 항목", font=("Arial", 11, "bold"), bg="#ffe6e6").pack(fill=tk.X)
         self.not_found_text = scrolledtext.ScrolledText(right_frame, wrap=tk.WORD, bg="#f5f5f5")
         self.not_found_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        # 결과 텍스트 태그는 위젯 생성 시 한 번만 설정
+        self.found_text.tag_config("green", foreground="green", font=("Arial", 11, "bold"))
+        self.found_text.tag_config("red", foreground="red", font=("Arial", 11, "bold"))
+        self.found_text.tag_config("content", font=("Arial", 10), foreground="black")
+        self.not_found_text.tag_config("red", foreground="red", font=("Arial", 11, "bold"))
 
         # 창 렌더링 후 70:30 비율 설정
         self.root.after(100, self._set_result_paned_sash)
@@ -2502,6 +2786,21 @@ class JSONValidatorGUI:
     def _update_scrollregion(self, event):
         """Canvas의 스크롤 영역 업데이트"""
         self.buttons_canvas.configure(scrollregion=self.buttons_canvas.bbox("all"))
+
+    def _schedule_scrollregion_update(self):
+        """
+        스크롤 영역 갱신을 유휴 시점으로 미룸
+        
+        연속된 아코디언 토글 등으로 여러 번 요청되어도 레이아웃 계산은 한 번만 수행된다.
+        """
+        if not self._scrollregion_pending:
+            self._scrollregion_pending = True
+            self.buttons_canvas.after_idle(self._apply_scrollregion)
+
+    def _apply_scrollregion(self):
+        """예약된 스크롤 영역 갱신 실행"""
+        self._scrollregion_pending = False
+        self.buttons_canvas.configure(scrollregion=self.buttons_canvas.bbox("all"))
     
 
     def _on_mousewheel_horizontal(self, event):
@@ -2648,8 +2947,9 @@ class JSONValidatorGUI:
         
         step_index = 0
         animation_dots = 0
+        stop_event = self.stop_progress_animation
         
-        while not self.validation_completed and not self.stop_progress_animation:
+        while not self.validation_completed and not stop_event.is_set():
             base_message = progress_steps[step_index]
             dots = "." * animation_dots
             self.progress_label.config(text=f"{base_message}{dots}")
@@ -2657,7 +2957,9 @@ class JSONValidatorGUI:
             animation_dots = (animation_dots + 1) % 4
             if animation_dots == 0:
                 step_index = (step_index + 1) % len(progress_steps)
-            time.sleep(0.3)
+            # 완료 신호가 오면 남은 대기 시간 없이 바로 종료
+            if stop_event.wait(0.3):
+                break
     
     def start_validation(self):
         """검증 작업을 시작"""
@@ -2682,7 +2984,7 @@ class JSONValidatorGUI:
         
         self.is_validating = True
         self.validation_completed = False
-        self.stop_progress_animation = False
+        self.stop_progress_animation = threading.Event()
         
         self.found_text.delete(1.0, tk.END)
         self.not_found_text.delete(1.0, tk.END)
@@ -2690,8 +2992,7 @@ class JSONValidatorGUI:
         self.table_paths = []
         self.test_contents = {}
         
-        for widget in self.buttons_frame.winfo_children():
-            widget.destroy()
+        self._clear_result_buttons()
         
         self.validate_button.config(text="판정 중...", state=tk.DISABLED, bg="#cccccc")
         self.progress_bar.start(10)
@@ -2731,6 +3032,10 @@ class JSONValidatorGUI:
                 result['error'] = f"JSON 파일 로드 중 오류 발생: {str(e)}"
                 return
             
+            self._page_joined = None
+            self._page_te_counts_key = None
+            self._image_id_cache = {}
+            
             try:
                 search_values = ConfigReader.read_config_file(config_path)
                 result['search_values'] = search_values
@@ -2749,7 +3054,7 @@ class JSONValidatorGUI:
             
             if result['success']:
                 for value in found_items.keys():
-                    if re.match(r'^TE\d+(\.\d+)+$', value):
+                    if _TE_RE.match(value):
                         test_content = self._get_test_content(value)
                         self.test_contents[value] = test_content
             
@@ -2873,8 +3178,10 @@ class JSONValidatorGUI:
             for table in page.get("tables", []):
                 caption = table.get("caption", "")
                 cells = table.get("cells", [])
-                if te_number in caption or any(te_number in cell.get("text", "") for cell in cells):
-                    if "시험결과 판정 근거" in caption or any("시험결과 판정 근거" in cell.get("text", "") for cell in cells):
+                # 캡션과 셀 텍스트를 구분자(\x01)로 이어 붙여 한 번씩만 검색
+                table_text = "\x01".join([caption] + [cell.get("text", "") for cell in cells])
+                if te_number in table_text:
+                    if "시험결과 판정 근거" in table_text:
                         judgment_section = [f"테이블 캡션: {caption}"]
                         for cell in cells:
                             cell_text = cell.get("text", "").strip()
@@ -2916,7 +3223,7 @@ class JSONValidatorGUI:
         """검증이 완료된 후 UI 업데이트 수행"""
         self.progress_bar.stop()
         self.validation_completed = True
-        self.stop_progress_animation = True
+        self.stop_progress_animation.set()
         
         if result['success']:
             found_items = result['found_items']
@@ -2928,8 +3235,10 @@ class JSONValidatorGUI:
             self.progress_label.config(text="검증 완료")
             
             self.found_paths = found_items
-            self._display_results(found_items, not_found_items)
-            self._create_test_result_buttons(found_items)
+            # 여러 소비자가 같은 항목을 순회하므로 (값, 경로) 목록을 한 번만 만든다
+            found_entries = list(found_items.items())
+            self._display_results(found_entries, not_found_items)
+            self._create_test_result_buttons(found_entries)
             
             # test_contents를 validator 객체에 저장
             self.validator.test_contents = self.test_contents
@@ -2969,12 +3278,13 @@ class JSONValidatorGUI:
             not_found_items (list): 못 찾은 항목 리스트
         """
         te_numbers = []
+        found_lines = []
         
         for value, paths in found_items.items():
-            if re.match(r'^TE\d+(\.\d+)+$', value):
+            if _TE_RE.match(value):
                 te_numbers.append(value)
             
-            self.found_text.insert(tk.END, f"✓ 값 '{value}' 발견\n", "green")
+            found_lines.append(f"✓ 값 '{value}' 발견\n")
             
             """for i, path in enumerate(paths):
                 self.found_text.insert(tk.END, f"  - 경로: {path}\n")
@@ -2987,37 +3297,30 @@ class JSONValidatorGUI:
         
         self.te_numbers = te_numbers
         
-        for value in not_found_items:
-            self.not_found_text.insert(tk.END, f"✗ 값 '{value}' 찾을 수 없음\n", "red")
-        
-        self.found_text.tag_config("green", foreground="green", font=("Arial", 11, "bold"))
-        self.found_text.tag_config("red", foreground="red", font=("Arial", 11, "bold"))
-        self.found_text.tag_config("content", font=("Arial", 10), foreground="black")
-        self.not_found_text.tag_config("red", foreground="red", font=("Arial", 11, "bold"))
+        if found_lines:
+            self.found_text.insert(tk.END, "".join(found_lines), "green")
+        if not_found_items:
+            self.not_found_text.insert(
+                tk.END,
+                "".join(f"✗ 값 '{value}' 찾을 수 없음\n" for value in not_found_items),
+                "red"
+            )
 
     ##여기부터 added by yj
-    def _create_test_result_buttons(self, found_items):
+    def _create_test_result_buttons(self, found_entries):
+            # TE 목록과 그룹은 _display_results에서 _compute_te_index로 이미 계산됨
             self.table_paths = []
-            te_numbers = []
             
-            for value, paths in found_items.items():
-                if re.match(r'^TE\d+(\.\d+)+$', value):
-                    te_numbers.append(value)
-            
-            self.te_numbers = te_numbers
-            
-            if hasattr(self, 'te_numbers') and self.te_numbers:
+            if self.te_numbers:
                 tk.Label(
                     self.buttons_frame, 
                     text="시험항목 및 시험결과", 
-                    font=("Arial", 10, "bold"),
-                    bg="#f5f5f5"
+                    font=self._font_header,
+                    **self._LABEL_HDR_KW
                 ).pack(anchor=tk.W, pady=(5, 3))
                 
-                te_groups = self._group_te_numbers(te_numbers)
-                
-                for main_te, sub_tes in te_groups.items():
-                    self._create_accordion_group(main_te, sub_tes)
+                for group_idx, (main_te, sub_tes) in enumerate(self.te_groups.items()):
+                    self._create_accordion_group(group_idx, main_te, sub_tes)
             
             if not PIL_AVAILABLE:
                 warning_label = tk.Label(
@@ -3030,8 +3333,7 @@ class JSONValidatorGUI:
                 )
                 warning_label.pack(fill=tk.X)
             
-            self.buttons_frame.update_idletasks()
-            self.buttons_canvas.configure(scrollregion=self.buttons_canvas.bbox("all"))
+            self._schedule_scrollregion_update()
             
             self.buttons_canvas.master.update_idletasks()
             parent_height = self.buttons_canvas.master.winfo_height()
@@ -3039,70 +3341,116 @@ class JSONValidatorGUI:
             
             self.buttons_canvas.configure(height=canvas_height)
 
-    def _group_te_numbers(self, te_numbers):
+    def _compute_te_index(self, found_entries):
+        """
+        검출 항목을 한 번 순회하여 TE 번호 목록과 상위 TE별 그룹을 함께 구성
+        
+        Args:
+            found_entries (list): (값, 경로 리스트) 튜플 목록
+        """
+        te_numbers = []
         groups = {}
         
-        for te_number in te_numbers:
-            main_te = te_number.split('.')[0]
-            
-            if main_te not in groups:
-                groups[main_te] = []
-            groups[main_te].append(te_number)
+        for value, paths in found_entries:
+            if _TE_RE.match(value):
+                te_numbers.append(value)
+                groups.setdefault(value.split('.', 1)[0], []).append(value)
         
-        for main_te in groups:
-            groups[main_te].sort()
+        for sub_tes in groups.values():
+            sub_tes.sort()
         
-        return groups
+        self.te_numbers = te_numbers
+        self.te_groups = groups
+        self.te_group_counts = {main_te: len(sub_tes) for main_te, sub_tes in groups.items()}
 
-    def _create_accordion_group(self, main_te, sub_tes):
-        group_frame = tk.Frame(self.buttons_frame, bg="#f5f5f5")
-        group_frame.pack(fill=tk.X, pady=2)
+    def _create_accordion_group(self, group_idx, main_te, sub_tes):
+        # 이전 검증에서 만든 그룹 위젯이 있으면 재사용하고, 부족할 때만 새로 생성
+        if group_idx < len(self._accordion_pool):
+            group = self._accordion_pool[group_idx]
+        else:
+            group_frame = tk.Frame(self.buttons_frame, bg="#f5f5f5")
+            
+            main_button = tk.Button(group_frame, font=self._font_main_btn, **self._MAIN_BTN_KW)
+            main_button.pack(fill=tk.X, padx=2, pady=1)
+            
+            sub_frame = tk.Frame(group_frame, bg="#f8f9fa")
+            
+            buttons_container = tk.Frame(sub_frame, bg="#f8f9fa")
+            buttons_container.pack(fill=tk.X, padx=10, pady=5)
+            
+            group = {
+                'frame': group_frame,
+                'button': main_button,
+                'sub_frame': sub_frame,
+                'container': buttons_container,
+                'sub_buttons': []
+            }
+            self._accordion_pool.append(group)
         
-        main_button = tk.Button(
-            group_frame,
+        group['frame'].pack(fill=tk.X, pady=2)
+        main_button = group['button']
+        sub_frame = group['sub_frame']
+        sub_frame.pack_forget()
+        main_button.config(
             text=f"▶ {main_te} 항목 ({len(sub_tes)}개)",
             command=lambda: self._toggle_accordion(main_te, main_button, sub_frame),
-            bg="#d4edda",
-            fg="#155724",
-            font=("Arial", 9, "bold"),
-            relief=tk.RAISED,
-            padx=10,
-            pady=5,
-            anchor=tk.W
+            bg="#d4edda"
         )
-        main_button.pack(fill=tk.X, padx=2, pady=1)
         
-        sub_frame = tk.Frame(group_frame, bg="#f8f9fa")
-        
-        buttons_container = tk.Frame(sub_frame, bg="#f8f9fa")
-        buttons_container.pack(fill=tk.X, padx=10, pady=5)
+        # 하위 버튼은 처음 펼칠 때 _build_accordion_sub_buttons에서 생성
+        self.accordion_states[main_te] = {
+            'expanded': False,
+            'button': main_button,
+            'frame': sub_frame,
+            'group': group,
+            'sub_tes': sub_tes,
+            'built': False
+        }
+
+    def _build_accordion_sub_buttons(self, state):
+        """
+        아코디언 그룹의 하위 TE 버튼 구성 (풀의 버튼을 재사용)
         
+        Args:
+            state (dict): accordion_states의 그룹 상태
+        """
+        group = state['group']
+        sub_tes = state['sub_tes']
+        sub_buttons = group['sub_buttons']
         for i, sub_te in enumerate(sub_tes):
-            sub_button = tk.Button(
-                buttons_container,
+            if i < len(sub_buttons):
+                sub_button = sub_buttons[i]
+            else:
+                sub_button = tk.Button(group['container'], font=self._font_sub_btn, **self._SUB_BTN_KW)
+                sub_button.bindtags(("AccordionSubBtn",) + sub_button.bindtags())
+                sub_buttons.append(sub_button)
+            
+            sub_button.config(
                 text=f"📋 {sub_te}",
                 command=lambda tn=sub_te: self._show_test_result_popup(tn),
-                bg="#e6f2ff",
-                fg="#0056b3",
-                font=("Arial", 8),
-                relief=tk.RAISED,
-                padx=8,
-                pady=4,
-                bd=1
+                bg="#e6f2ff"
             )
             sub_button.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=3, pady=2)
-            
-            sub_button.bind("<Enter>", lambda e, btn=sub_button: btn.config(bg="#cce7ff"))
-            sub_button.bind("<Leave>", lambda e, btn=sub_button: btn.config(bg="#e6f2ff"))
         
-        if not hasattr(self, 'accordion_states'):
-            self.accordion_states = {}
+        # 이번 그룹에서 쓰지 않는 풀의 나머지 버튼은 숨김
+        for sub_button in sub_buttons[len(sub_tes):]:
+            sub_button.pack_forget()
         
-        self.accordion_states[main_te] = {
-            'expanded': False,
-            'button': main_button,
-            'frame': sub_frame
-        }
+        state['built'] = True
+
+    def _clear_result_buttons(self):
+        """
+        결과 버튼 영역 초기화
+        
+        아코디언 그룹 위젯은 다음 검증에서 재사용하도록 숨기기만 하고 나머지는 삭제한다.
+        """
+        pooled_frames = {group['frame'] for group in self._accordion_pool}
+        for widget in self.buttons_frame.winfo_children():
+            if widget in pooled_frames:
+                widget.pack_forget()
+            else:
+                widget.destroy()
+        self.accordion_states = {}
 
     def _toggle_accordion(self, main_te, main_button, sub_frame):
         state = self.accordion_states[main_te]
@@ -3110,39 +3458,35 @@ class JSONValidatorGUI:
         if state['expanded']:
             sub_frame.pack_forget()
             main_button.config(
-                text=f"▶ {main_te} 항목 ({len([te for te in self.te_numbers if te.startswith(main_te)])}개)",
+                text=f"▶ {main_te} 항목 ({self.te_group_counts[main_te]}개)",
                 bg="#d4edda"
             )
             state['expanded'] = False
         else:
+            if not state['built']:
+                self._build_accordion_sub_buttons(state)
             sub_frame.pack(fill=tk.X, padx=10, pady=2)
             main_button.config(
-                text=f"▼ {main_te} 항목 ({len([te for te in self.te_numbers if te.startswith(main_te)])}개)",
+                text=f"▼ {main_te} 항목 ({self.te_group_counts[main_te]}개)",
                 bg="#c3e6cb"
             )
             state['expanded'] = True
         
-        self.buttons_frame.update_idletasks()
-        self.buttons_canvas.configure(scrollregion=self.buttons_canvas.bbox("all"))
+        self._schedule_scrollregion_update()
 
-    def _display_results(self, found_items, not_found_items):
-            te_numbers = []
-            
-            for value, paths in found_items.items():
-                if re.match(r'^TE\d+(\.\d+)+$', value):
-                    te_numbers.append(value)
-                
-                self.found_text.insert(tk.END, f"✓ 값 '{value}' 발견\n", "green")
-            
-            self.te_numbers = te_numbers
-            
-            for value in not_found_items:
-                self.not_found_text.insert(tk.END, f"✗ 값 '{value}' 찾을 수 없음\n", "red")
+    def _display_results(self, found_entries, not_found_items):
+            self._compute_te_index(found_entries)
+            found_lines = [f"✓ 값 '{value}' 발견\n" for value, paths in found_entries]
             
-            self.found_text.tag_config("green", foreground="green", font=("Arial", 11, "bold"))
-            self.found_text.tag_config("red", foreground="red", font=("Arial", 11, "bold"))
-            self.found_text.tag_config("content", font=("Arial", 10), foreground="black")
-            self.not_found_text.tag_config("red", foreground="red", font=("Arial", 11, "bold"))
+            # 모든 줄이 같은 태그를 쓰므로 위젯마다 insert 한 번으로 처리
+            if found_lines:
+                self.found_text.insert(tk.END, "".join(found_lines), "green")
+            if not_found_items:
+                self.not_found_text.insert(
+                    tk.END,
+                    "".join(f"✗ 값 '{value}' 찾을 수 없음\n" for value in not_found_items),
+                    "red"
+                )
 
     ###여기까지    
     
@@ -3157,7 +3501,7 @@ class JSONValidatorGUI:
         te_numbers = []
         
         for value, paths in found_items.items():
-            if re.match(r'^TE\d+(\.\d+)+$', value):
+            if _TE_RE.match(value):
                 te_numbers.append(value)
         
         self.te_numbers = te_numbers
@@ -3166,8 +3510,8 @@ class JSONValidatorGUI:
             tk.Label(
                 self.buttons_frame, 
                 text="시험결과", 
-                font=("Arial", 10, "bold"),
-                bg="#f5f5f5"
+                font=self._font_header,
+                **self._LABEL_HDR_KW
             ).pack(anchor=tk.W, pady=(5, 3))
             
             table_buttons_frame = tk.Frame(self.buttons_frame, bg="#f5f5f5")
@@ -3200,9 +3544,9 @@ class JSONValidatorGUI:
             )
             warning_label.pack(fill=tk.X)
         
-        # Canvas 크기 조정
+        # Canvas 크기 조정 (요청 높이 계산에는 레이아웃 갱신이 필요)
+        self._schedule_scrollregion_update()
         self.buttons_frame.update_idletasks()
-        self.buttons_canvas.configure(scrollregion=self.buttons_canvas.bbox("all"))
         # Canvas 높이를 버튼 프레임 높이에 맞게 제한 (최대 200픽셀)
         canvas_height = min(self.buttons_frame.winfo_reqheight(), 200)
         self.buttons_canvas.configure(height=canvas_height)
@@ -3277,38 +3621,42 @@ class JSONValidatorGUI:
         """
         검출된 TE 번호와 관련된 이미지에 대한 버튼을 생성
         """
-        if not self.validator.json_data or not te_numbers:
+        if not self.validator.json_data or not te_numbers or not self.validator.json_data.get("pages"):
             return
         
+        debug = getattr(self.validator, 'debug_mode', False)
+        
         try:
-            # 디버그 모드 활성화
-            if hasattr(self.validator, 'debug_mode'):
-                self.validator.debug_mode = True
-            
             # 1. 모든 이미지 수집
             all_images = self._collect_all_images_flexible()
             
-            if self.validator.debug_mode:
+            if debug:
                 print(f"=== TE 이미지 검색 디버그 ===")
                 print(f"검색할 TE 번호들: {te_numbers}")
                 print(f"전체 수집된 이미지 수: {len(all_images)}")
                 for i, img in enumerate(all_images):
                     print(f"  이미지 {i+1}: 위치={img.get('location', 'N/A')}, 키={list(img.keys())}")
             
-            # 2. 시험결과판정근거 표 이미지 식별
-            test_result_images = []
-            for te_number in te_numbers:
-                image_data = self.validator.get_test_result_image(te_number)
-                if image_data and (image_data.get('image') or image_data.get('base64')):
-                    test_result_images.append(image_data)
-            
-            if self.validator.debug_mode:
-                print(f"시험결과판정근거 표 이미지 수: {len(test_result_images)}")
-            
-            # 3. TE 관련 이미지 필터링
-            te_related_images = self._filter_te_related_images_improved(all_images, te_numbers, test_result_images)
+            # 수집된 이미지가 없으면 판정근거 표 이미지 생성과 TE 색인 구성을 생략
+            te_related_images = []
+            if all_images:
+                # 2. 시험결과판정근거 표 이미지 식별
+                test_result_images = []
+                for te_number in te_numbers:
+                    image_data = self.validator.get_test_result_image(te_number)
+                    if image_data and (image_data.get('image') or image_data.get('base64')):
+                        test_result_images.append(image_data)
+                
+                if debug:
+                    print(f"시험결과판정근거 표 이미지 수: {len(test_result_images)}")
+                self._set_test_result_images(test_result_images)
+                
+                # 3. TE 관련 이미지 필터링
+                self._prepare_te_lookup(te_numbers)
+                self._build_te_page_index()
+                te_related_images = self._filter_te_related_images_improved(all_images, te_numbers, test_result_images)
             
-            if self.validator.debug_mode:
+            if debug:
                 print(f"최종 TE 관련 이미지 수: {len(te_related_images)}")
                 for i, img in enumerate(te_related_images):
                     print(f"  TE 이미지 {i+1}: TE={img.get('te_number', 'N/A')}, 캡션={img.get('caption', 'N/A')}")
@@ -3318,8 +3666,8 @@ class JSONValidatorGUI:
                 tk.Label(
                     self.buttons_frame, 
                     text="TE 관련 이미지 보기:", 
-                    font=("Arial", 10, "bold"),
-                    bg="#f5f5f5"
+                    font=self._font_header,
+                    **self._LABEL_HDR_KW
                 ).pack(anchor=tk.W, pady=(15, 3))
                 
                 image_buttons_frame = tk.Frame(self.buttons_frame, bg="#f5f5f5")
@@ -3337,25 +3685,21 @@ class JSONValidatorGUI:
                         image_buttons_frame, 
                         text=img_desc,
                         command=lambda idata=img_data: self._show_image_popup_with_data(idata),
-                        bg="#e6e6ff",
-                        padx=5,
-                        pady=2,
-                        font=("Arial", 9),  # 폰트 크기 조정
-                        wraplength=200,     # 텍스트 줄바꿈 너비 설정
-                        justify=tk.LEFT     # 텍스트 왼쪽 정렬
+                        font=self._font_img_btn,
+                        **self._IMG_BTN_KW  # 줄바꿈 너비 200, 왼쪽 정렬
                     )
                     # 가로 배치를 위해 pack 사용
                     img_btn.pack(side=tk.LEFT, padx=3, pady=3)
                     img_btn_count += 1
                     
-                    if self.validator.debug_mode:
+                    if debug:
                         print(f"버튼 생성: TE={te_num}, 캡션={img_desc}")
             else:
                 info_label = tk.Label(
                     self.buttons_frame,
                     text="TE 관련 이미지 보기:", 
-                    font=("Arial", 10, "bold"),
-                    bg="#f5f5f5"
+                    font=self._font_header,
+                    **self._LABEL_HDR_KW
                 ).pack(anchor=tk.W, pady=(15, 3))
                 
                 image_buttons_frame = tk.Frame(self.buttons_frame, bg="#f5f5f5")
@@ -3372,7 +3716,7 @@ class JSONValidatorGUI:
                 no_images_label.pack(anchor=tk.W, padx=5)
                 
         except Exception as e:
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+            if debug:
                 print(f"TE 관련 이미지 버튼 생성 중 오류 발생: {str(e)}")
                 import traceback
                 traceback.print_exc()
@@ -3388,13 +3732,13 @@ class JSONValidatorGUI:
             error_label.pack(fill=tk.X)
         
         # Canvas 스크롤 영역 업데이트
-        self.buttons_frame.update_idletasks()
-        self.buttons_canvas.configure(scrollregion=self.buttons_canvas.bbox("all"))
+        self._schedule_scrollregion_update()
 
     def _collect_all_images_flexible(self):
         """
         JSON에서 모든 이미지를 유연한 조건으로 수집
         """
+        debug = getattr(self.validator, 'debug_mode', False)
         all_images = []
         
         for page_idx, page in enumerate(self.validator.json_data.get("pages", [])):
@@ -3408,25 +3752,17 @@ class JSONValidatorGUI:
                     if img is None:
                         continue
                     
-                    # 더 유연한 이미지 데이터 확인 (조건 완화)
-                    has_image_data = (
-                        img.get('base64') or 
-                        img.get('file_path') or 
-                        img.get('image_data') or 
-                        img.get('src') or 
-                        img.get('url') or
-                        img.get('caption') or  # 캡션만 있어도 이미지로 간주
-                        img.get('image_id')    # 이미지 ID만 있어도 포함
-                    )
-                    
-                    if has_image_data:
-                        img_copy = img.copy()
-                        img_copy['page_idx'] = page_idx
-                        img_copy['image_idx'] = img_idx
-                        img_copy['location'] = f"pages[{page_idx}].images[{img_idx}]"
+                    # 더 유연한 이미지 데이터 확인 (캡션이나 이미지 ID만 있어도 포함)
+                    if any(img.get(key) for key in _IMG_DATA_KEYS):
+                        # 원본 dict(큰 base64 포함)를 복사하지 않고 위치 정보만 덧씌움
+                        img_copy = ChainMap({
+                            'page_idx': page_idx,
+                            'image_idx': img_idx,
+                            'location': f"pages[{page_idx}].images[{img_idx}]"
+                        }, img)
                         all_images.append(img_copy)
                         
-                        if self.validator.debug_mode:
+                        if debug:
                             print(f"수집된 페이지 이미지: {img_copy.get('location')}, 키: {list(img.keys())}")
             
             # 2. 테이블 내 이미지
@@ -3438,26 +3774,19 @@ class JSONValidatorGUI:
                         
                     if "image" in table and isinstance(table["image"], dict):
                         img = table["image"]
-                        has_image_data = (
-                            img.get('base64') or 
-                            img.get('file_path') or 
-                            img.get('image_data') or 
-                            img.get('src') or 
-                            img.get('url') or
-                            table.get('caption') or  # 테이블 캡션도 고려
-                            table.get('table_id')    # 테이블 ID도 고려
-                        )
-                        
-                        if has_image_data:
-                            img_copy = img.copy()
-                            img_copy['page_idx'] = page_idx
-                            img_copy['table_idx'] = table_idx
-                            img_copy['location'] = f"pages[{page_idx}].tables[{table_idx}].image"
-                            img_copy['table_caption'] = table.get('caption', '')
-                            img_copy['table_id'] = table.get('table_id', '')
+                        # 이미지 데이터가 없으면 테이블 캡션/ID도 고려
+                        if (any(img.get(key) for key in _IMG_SOURCE_KEYS) or
+                                table.get('caption') or table.get('table_id')):
+                            img_copy = ChainMap({
+                                'page_idx': page_idx,
+                                'table_idx': table_idx,
+                                'location': f"pages[{page_idx}].tables[{table_idx}].image",
+                                'table_caption': table.get('caption', ''),
+                                'table_id': table.get('table_id', '')
+                            }, img)
                             all_images.append(img_copy)
                             
-                            if self.validator.debug_mode:
+                            if debug:
                                 print(f"수집된 테이블 이미지: {img_copy.get('location')}, 키: {list(img.keys())}")
         
         return all_images
@@ -3466,13 +3795,14 @@ class JSONValidatorGUI:
         """
         수집된 이미지 중에서 TE 관련 이미지만 필터링
         """
+        debug = getattr(self.validator, 'debug_mode', False)
         te_related_images = []
         te_numbers_str = [str(te) for te in te_numbers]
         
         for img in all_images:
             # 시험결과판정근거 이미지 제외 조건을 더 엄격하게 적용
             if self._is_test_result_image_strict(img, test_result_images):
-                if self.validator.debug_mode:
+                if debug:
                     print(f"제외: 시험결과판정근거 표 이미지 - {img.get('location')}, 캡션={img.get('caption', 'N/A')}")
                 continue
             
@@ -3480,8 +3810,7 @@ class JSONValidatorGUI:
             related_te = self._find_related_te_number_improved(img, te_numbers_str)
             
             if related_te:
-                img_copy = img.copy()
-                img_copy['te_number'] = related_te
+                img_copy = img.new_child({'te_number': related_te})
                 
                 # 캡션이 없으면 생성
                 if 'caption' not in img_copy or not img_copy['caption']:
@@ -3489,123 +3818,156 @@ class JSONValidatorGUI:
                 
                 te_related_images.append(img_copy)
                 
-                if self.validator.debug_mode:
+                if debug:
                     print(f"포함: TE 관련 이미지 - {img.get('location')}, TE={related_te}, 캡션={img_copy.get('caption', 'N/A')}")
             else:
-                if self.validator.debug_mode:
+                if debug:
                     print(f"제외: TE 관련성 없음 - {img.get('location')}, 캡션={img.get('caption', 'N/A')}")
         
         return te_related_images
 
+    def _prepare_te_lookup(self, te_numbers):
+        """
+        이미지-TE 매칭에 쓰는 TE 변형 목록과 검색 정규식을 검증 결과마다 한 번 구성
+        
+        Args:
+            te_numbers (list): 검출된 TE 번호 리스트
+        """
+        # 같은 TE 목록이면 이전에 만든 변형/정규식을 그대로 사용
+        lookup_key = tuple(te_numbers)
+        if lookup_key == self._te_lookup_key:
+            return
+        
+        # TE02.03.01 -> TE02.03.01, TE02_03_01, TE02-03-01
+        self._te_variants = [v for te in te_numbers for v in _te_variants(te)]
+        self._te_canonical = {v.lower(): te for te in te_numbers for v in _te_variants(te)}
+        self._te_variants_re = re.compile('|'.join(re.escape(v.lower()) for v in self._te_variants))
+        self._te_variants_page_re = re.compile('|'.join(re.escape(v) for v in self._te_variants))
+        self._te_lookup_key = lookup_key
+        self._page_te_counts_key = None
+
+    def _get_page_joined_texts(self):
+        """
+        페이지별 텍스트, 텍스트 블록, 테이블 캡션/셀을 이어 붙인 버퍼를 반환
+        
+        페이지 텍스트, 각 텍스트 블록, 각 테이블(캡션+셀)은 \x1e로, 테이블 안의 캡션/셀은 \x1f로 구분한다.
+        TE 번호와 무관하므로 JSON 로드마다 한 번만 만들고 재사용한다.
+        
+        Returns:
+            dict: {페이지 인덱스: 이어 붙인 텍스트}
+        """
+        if self._page_joined is not None:
+            return self._page_joined
+        
+        page_joined = {}
+        for page_idx, page in enumerate(self.validator.json_data.get("pages", [])):
+            if not page:
+                continue
+            
+            parts = [page.get("text") or ""]
+            for text_block in page.get("text_blocks", []):
+                if text_block and text_block.get('text'):
+                    parts.append(text_block['text'])
+            for table in page.get("tables", []):
+                if not table:
+                    continue
+                table_parts = [table.get("caption") or ""]
+                for cell in table.get("cells", []):
+                    if cell and cell.get('text'):
+                        table_parts.append(cell['text'])
+                parts.append("\x1f".join(table_parts))
+            
+            page_joined[page_idx] = "\x1e".join(parts)
+        
+        self._page_joined = page_joined
+        return page_joined
+
+    def _build_te_page_index(self):
+        """
+        페이지별 TE 번호 등장 횟수(Counter)와 TE 번호가 처음 나오는 구역의 TE 번호 집합을 구성
+        
+        _get_page_joined_texts의 페이지 버퍼에서 TE 변형(., _, -) 전체를 묶은 정규식으로
+        TE 번호가 있는 페이지만 골라 변형별 등장 횟수를 센다.
+        구역(페이지 텍스트, 텍스트 블록, 테이블) 순서는 인접 페이지 매칭의 우선순위로 쓰인다.
+        """
+        # 같은 JSON과 같은 TE 목록으로 이미 만든 색인은 재사용
+        if self._page_te_counts_key is not None and self._page_te_counts_key == self._te_lookup_key:
+            return
+        
+        self._page_te_counts = {}
+        self._page_first_te_set = {}
+        if not self._te_variants:
+            return
+        
+        variants_re = self._te_variants_page_re
+        te_canonical = self._te_canonical
+        for page_idx, joined_text in self._get_page_joined_texts().items():
+            # 정규식은 TE 번호가 있는 페이지를 거르는 데만 사용
+            first = variants_re.search(joined_text)
+            if first:
+                # 개수는 기존과 같이 변형별 str.count 합으로 센다.
+                # (정규식 findall은 TE02.03.01이 TE02.03.011 안에 포함된 경우를 세지 않아 결과가 달라짐)
+                self._page_te_counts[page_idx] = Counter({
+                    te: sum(joined_text.count(v) for v in _te_variants(te))
+                    for te in self._te_lookup_key
+                })
+                
+                # 첫 매칭이 속한 구역(다음 \x1e 전까지)에 등장하는 TE 번호 집합
+                unit_end = joined_text.find("\x1e", first.end())
+                unit_text = joined_text[first.start():unit_end] if unit_end != -1 else joined_text[first.start():]
+                self._page_first_te_set[page_idx] = {
+                    te_canonical[v.lower()] for v in self._te_variants if v in unit_text
+                }
+        
+        self._page_te_counts_key = self._te_lookup_key
+
     def _find_related_te_number_improved(self, img, te_numbers_str):
         """
         이미지가 어떤 TE 번호와 관련이 있는지 확인
         """
-        te_variants = []
-        for te in te_numbers_str:
-            te_variants.append(te)
-            te_variants.append(te.replace('.', '_'))  # TE02.03.01 -> TE02_03_01
-            te_variants.append(te.replace('.', '-'))  # TE02.03.01 -> TE02-03-01
+        debug = getattr(self.validator, 'debug_mode', False)
         
-        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+        if debug:
             print(f"\n=== TE 번호 매칭 시도: 캡션='{img.get('caption', 'N/A')}', 파일 경로='{img.get('file_path', 'N/A')}' ===")
         
-        # 1. 이미지 자체 속성에서 TE 번호 검색
-        search_fields = [
-            'caption', 'file_path', 'image_id', 'src', 'url', 'alt', 'title',
-            'description', 'name', 'filename', 'path', 'table_caption', 'table_id'
-        ]
-        
-        for field in search_fields:
-            if field in img and img[field]:
-                field_value = str(img[field]).lower()
-                for te_variant in te_variants:
-                    if te_variant.lower() in field_value:
-                        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                            print(f"TE 매칭 성공: 필드={field}, 값={field_value}, TE={te_variant}")
-                        return te_variant.replace('_', '.').replace('-', '.')  # 원래 TE 형식으로 변환
+        # 1. 이미지 자체 속성에서 TE 번호 검색 (소문자 필드값을 합쳐 한 번에 검색)
+        field_values = [str(value).lower() for value in map(img.get, _SEARCH_FIELDS) if value]
+        if field_values:
+            match = self._te_variants_re.search("\n".join(field_values))
+            if match:
+                if debug:
+                    print(f"TE 매칭 성공: 이미지 속성, TE={match.group(0)}")
+                return self._te_canonical[match.group(0)]  # 원래 TE 형식으로 변환
         
         # 2. Figure 키워드 포함 시 TE 번호 추정
         caption = img.get('caption', '').lower()
         file_path = img.get('file_path', '').lower()
-        page_idx = img.get('page_idx', -1)
-        
-        # 판정근거 페이지 인덱스 확인
-        judgment_page_idx = -1
-        pages = self.validator.json_data.get("pages", [])
-        judgment_pattern = r'판정\s*근거'
-        for idx, page in enumerate(pages):
-            if page and re.search(judgment_pattern, page.get("text", ""), re.IGNORECASE):
-                judgment_page_idx = idx
-                break
-        
-        if page_idx <= judgment_page_idx or judgment_page_idx == -1:
-            # 다른 TE 번호가 포함된 경우 제외
-            other_te_matches = [m for m in re.findall(r'TE\d+\.\d+\.\d+', caption + " " + file_path) if m not in te_variants]
-            if other_te_matches:
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                    print(f"TE 매칭 실패: 다른 TE 번호={other_te_matches}, 캡션={caption}, 파일 경로={file_path}")
+        if 'figure' in caption or 'figure' in file_path:
+            closest_te = self._find_closest_te_number(img, te_numbers_str)
+            if closest_te:
+                if debug:
+                    print(f"TE 매칭 성공: Figure 기반, 추정된 TE={closest_te}, 캡션={caption}, 파일 경로={file_path}")
+                return closest_te
+            else:
+                if debug:
+                    print(f"TE 매칭 실패: Figure 포함 but TE 번호 추정 실패, 캡션={caption}, 파일 경로={file_path}")
                 return None
-            
-            if 'figure' in caption or 'figure' in file_path:
-                closest_te = self._find_closest_te_number(img, te_numbers_str)
-                if closest_te and closest_te in te_numbers_str:
-                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                        print(f"TE 매칭 성공: Figure 기반, 추정된 TE={closest_te}, 캡션={caption}, 파일 경로={file_path}")
-                    return closest_te
-                else:
-                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                        print(f"TE 매칭 실패: Figure 포함 but TE 번호 추정 실패, 캡션={caption}, 파일 경로={file_path}")
-        
-        # 3. 동일 페이지 및 인접 페이지(±1)에서 TE 번호 검색
-        if page_idx != -1:
-            pages_to_check = [page_idx]
-            if page_idx > 0:
-                pages_to_check.append(page_idx - 1)  # 이전 페이지
-            if page_idx < len(pages) - 1:
-                pages_to_check.append(page_idx + 1)  # 다음 페이지
-            
-            for check_page_idx in pages_to_check:
-                if check_page_idx < len(pages) and check_page_idx <= judgment_page_idx:
-                    page = pages[check_page_idx]
-                    if page:
-                        # 페이지 텍스트에서 TE 번호 검색
-                        page_text = page.get("text", "")
-                        if page_text:
-                            for te_variant in te_variants:
-                                if te_variant in page_text:
-                                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                        print(f"TE 매칭 성공: 페이지 {check_page_idx} 텍스트, TE={te_variant}")
-                                    return te_variant.replace('_', '.').replace('-', '.')
-                        
-                        # 텍스트 블록에서 TE 번호 검색
-                        text_blocks = page.get("text_blocks", [])
-                        for text_block in text_blocks:
-                            if text_block and 'text' in text_block:
-                                block_text = text_block['text']
-                                if block_text:
-                                    for te_variant in te_variants:
-                                        if te_variant in block_text:
-                                            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                                print(f"TE 매칭 성공: 페이지 {check_page_idx} 텍스트 블록, TE={te_variant}")
-                                            return te_variant.replace('_', '.').replace('-', '.')
-                        
-                        # 테이블에서 TE 번호 검색
-                        tables = page.get("tables", [])
-                        for table in tables:
-                            if table:
-                                caption = table.get("caption", "")
-                                cells = table.get("cells", [])
-                                cell_texts = [cell.get("text", "") for cell in cells if cell and 'text' in cell]
-                                
-                                for te_variant in te_variants:
-                                    if (caption and te_variant in caption) or \
-                                    any(te_variant in cell_text for cell_text in cell_texts):
-                                        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                            print(f"TE 매칭 성공: 페이지 {check_page_idx} 테이블, TE={te_variant}")
-                                        return te_variant.replace('_', '.').replace('-', '.')
         
-        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+        # 3. 동일 페이지 및 인접 페이지(±1)에서 TE 번호 검색 (미리 만든 페이지→TE 색인 사용)
+        if 'page_idx' in img:
+            page_idx = img['page_idx']
+            page_first_te_set = getattr(self, '_page_first_te_set', {})
+            for check_page_idx in (page_idx, page_idx - 1, page_idx + 1):
+                hit = page_first_te_set.get(check_page_idx)
+                if not hit:
+                    continue
+                for te in te_numbers_str:
+                    if te in hit:
+                        if debug:
+                            print(f"TE 매칭 성공: 페이지 {check_page_idx}, TE={te}")
+                        return te
+        
+        if debug:
             print(f"TE 매칭 실패: 모든 조건 불만족")
         return None
 
@@ -3616,53 +3978,19 @@ class JSONValidatorGUI:
         if 'page_idx' not in img:
             return None
         
+        # _build_te_page_index에서 만든 페이지별 등장 횟수를 동일/인접 페이지에 대해 합산
         page_idx = img['page_idx']
-        pages_to_check = [page_idx]
-        if page_idx > 0:
-            pages_to_check.append(page_idx - 1)
-        if page_idx < len(self.validator.json_data.get("pages", [])) - 1:
-            pages_to_check.append(page_idx + 1)
-        
-        te_counts = {te: 0 for te in te_numbers_str}
-        
-        for check_page_idx in pages_to_check:
-            if check_page_idx < len(self.validator.json_data.get("pages", [])):
-                page = self.validator.json_data.get("pages", [])[check_page_idx]
-                if page:
-                    # 페이지 텍스트에서 TE 번호 카운트
-                    page_text = page.get("text", "")
-                    for te in te_numbers_str:
-                        te_variants = [te, te.replace('.', '_'), te.replace('.', '-')]
-                        for variant in te_variants:
-                            te_counts[te] += page_text.count(variant)
-                    
-                    # 텍스트 블록에서 TE 번호 카운트
-                    for text_block in page.get("text_blocks", []):
-                        if text_block and 'text' in text_block:
-                            block_text = text_block['text']
-                            for te in te_numbers_str:
-                                te_variants = [te, te.replace('.', '_'), te.replace('.', '-')]
-                                for variant in te_variants:
-                                    te_counts[te] += block_text.count(variant)
-                    
-                    # 테이블에서 TE 번호 카운트
-                    for table in page.get("tables", []):
-                        caption = table.get("caption", "")
-                        cells = table.get("cells", [])
-                        cell_texts = [cell.get("text", "") for cell in cells if cell and 'text' in cell]
-                        for te in te_numbers_str:
-                            te_variants = [te, te.replace('.', '_'), te.replace('.', '-')]
-                            for variant in te_variants:
-                                if caption:
-                                    te_counts[te] += caption.count(variant)
-                                for cell_text in cell_texts:
-                                    te_counts[te] += cell_text.count(variant)
-        
-        # 가장 많이 등장한 TE 번호 반환
+        te_counts = Counter()
+        for check_page_idx in (page_idx, page_idx - 1, page_idx + 1):
+            page_counts = self._page_te_counts.get(check_page_idx)
+            if page_counts:
+                te_counts.update(page_counts)
+        
+        # 가장 많이 등장한 TE 번호 반환 (동률이면 te_numbers_str 순서상 앞선 TE 번호)
         if te_counts:
-            max_te = max(te_counts, key=te_counts.get)
-            if te_counts[max_te] > 0:
-                return max_te
+            closest_te = max(te_numbers_str, key=te_counts.__getitem__)
+            if te_counts[closest_te] > 0:
+                return closest_te
         return None
     
 
@@ -3679,6 +4007,18 @@ class JSONValidatorGUI:
         else:
             return f"{te_number} 관련 이미지 (페이지 {page_idx + 1})"
 
+    def _set_test_result_images(self, test_result_images):
+        """
+        시험결과판정근거 표 이미지 목록을 등록하고 식별자 집합을 한 번만 계산
+        
+        Args:
+            test_result_images (list): 시험결과판정근거 표 이미지 데이터 목록
+        """
+        self._test_result_images = test_result_images
+        self._test_result_identifier_set = {
+            identifier for identifier in map(self._get_image_identifier, test_result_images) if identifier
+        }
+
     def _is_test_result_image_strict(self, image_data, test_result_images):
         """
         주어진 이미지가 시험결과판정근거 이미지인지 확인
@@ -3696,34 +4036,34 @@ class JSONValidatorGUI:
             return False
         
         # "시험결과판정근거" 또는 "Table" 키워드가 포함된 경우만 판정근거로 간주
-        judgment_keywords = ['시험결과판정근거', '판정근거', 'judgment', 'result table', 'table']
-        
-        for keyword in judgment_keywords:
-            if keyword in caption or keyword in table_caption:
-                if self.validator.debug_mode:
-                    print(f"판정근거 키워드 발견: {keyword}, 캡션={caption}, 테이블 캡션={table_caption}")
-                return True
+        keyword_match = _JUDGMENT_KEYWORD_RE.search(caption) or _JUDGMENT_KEYWORD_RE.search(table_caption)
+        if keyword_match:
+            if self.validator.debug_mode:
+                print(f"판정근거 키워드 발견: {keyword_match.group()}, 캡션={caption}, 테이블 캡션={table_caption}")
+            return True
         
         # 파일 경로에 판정근거 키워드가 있는 경우
         file_path = image_data.get('file_path', '').lower()
         if file_path:
-            for keyword in judgment_keywords:
-                if keyword in file_path:
-                    if self.validator.debug_mode:
-                        print(f"판정근거 키워드 발견: {keyword}, 파일 경로={file_path}")
-                    return True
+            keyword_match = _JUDGMENT_KEYWORD_RE.search(file_path)
+            if keyword_match:
+                if self.validator.debug_mode:
+                    print(f"판정근거 키워드 발견: {keyword_match.group()}, 파일 경로={file_path}")
+                return True
         
         # 이미지 식별자 비교
         image_identifier = self._get_image_identifier(image_data)
         if not image_identifier:
             return False
         
-        for test_img in test_result_images:
-            test_identifier = self._get_image_identifier(test_img)
-            if test_identifier and image_identifier == test_identifier:
-                if self.validator.debug_mode:
-                    print(f"이미지 식별자 매칭: {image_identifier}")
-                return True
+        if test_result_images is self._test_result_images:
+            test_identifiers = self._test_result_identifier_set
+        else:
+            test_identifiers = {self._get_image_identifier(test_img) for test_img in test_result_images}
+        if image_identifier in test_identifiers:
+            if self.validator.debug_mode:
+                print(f"이미지 식별자 매칭: {image_identifier}")
+            return True
         
         return False
     
@@ -3731,14 +4071,23 @@ class JSONValidatorGUI:
     def _get_image_identifier(self, img):
         """
         이미지의 고유 식별자를 생성
+        
+        base64 해시는 원본 문자열을 키로 캐시하여 같은 이미지를 다시 해시하지 않음
+        (JSON 파일을 새로 불러오면 캐시를 비움)
         """
         if 'base64' in img and img['base64']:
-            base64_data = img['base64']
+            raw_data = img['base64']
+            cached = self._image_id_cache.get(raw_data)
+            if cached is not None:
+                return cached
+            base64_data = raw_data
             if base64_data.startswith('data:image'):
                 base64_parts = base64_data.split(',', 1)
                 if len(base64_parts) > 1:
                     base64_data = base64_parts[1]
-            return hashlib.sha256(base64_data.encode()).hexdigest()
+            identifier = hashlib.blake2b(base64_data.encode(), digest_size=16).hexdigest()
+            self._image_id_cache[raw_data] = identifier
+            return identifier
         elif 'file_path' in img and img['file_path']:
             return img['file_path']
         elif 'src' in img and img['src']:
@@ -3788,7 +4137,7 @@ class JSONValidatorGUI:
                     title = f"{title} - {enhanced_image_data['caption']}"
                 
                 # ImageViewerPopup 호출
-                ImageViewerPopup(self.root, title, enhanced_image_data)
+                ImageViewerPopup(self.root, title, enhanced_image_data, validator=self.validator)
             else:
                 messagebox.showinfo(
                     "알림", 
@@ -3812,7 +4161,8 @@ class JSONValidatorGUI:
         Returns:
             dict: 로컬 파일 정보가 추가된 이미지 데이터
         """
-        enhanced_data = image_data.copy()
+        # 수집 단계의 ChainMap 오버레이도 팝업에는 일반 dict로 전달
+        enhanced_data = dict(image_data)
         
         try:
             # extracted_images 폴더에서 매칭되는 이미지 파일 검색
@@ -3855,19 +4205,15 @@ class JSONValidatorGUI:
                     print(f"extracted_images 폴더가 존재하지 않음: {image_folder}")
                 return None
             
-            # 지원되는 이미지 확장자
-            supported_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif']
-            
-            # 폴더 내 파일 목록 가져오기
+            # 폴더 내 파일 목록 가져오기 (폴더가 바뀌지 않았으면 캐시 재사용)
             try:
-                all_files = [f for f in os.listdir(image_folder) 
-                        if any(f.lower().endswith(ext) for ext in supported_extensions)]
+                file_entries = _scan_image_folder(image_folder)
             except Exception as e:
                 if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
                     print(f"폴더 읽기 오류: {image_folder}, 오류: {str(e)}")
                 return None
             
-            if not all_files:
+            if not file_entries:
                 if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
                     print(f"extracted_images 폴더에 이미지 파일이 없음")
                 return None
@@ -3884,17 +4230,26 @@ class JSONValidatorGUI:
                 print(f"  TE 번호: '{te_number}'")
                 print(f"  페이지: {page_num}")
                 print(f"  이미지 ID: '{image_id}'")
-                print(f"  사용 가능한 파일 수: {len(all_files)}")
+                print(f"  사용 가능한 파일 수: {len(file_entries)}")
             
-            # 1단계: 정확한 매칭
+            # 파일마다 다시 만들지 않도록 TE 변형은 한 번만 생성
+            te_variants = _te_filename_variants(te_number)
+            if te_variants:
+                te_variants += (te_number.replace('te', '').replace('.', '').lower(),)
+            
+            # 점수 규칙과 키워드 정규식은 파일 루프 밖에서 한 번만 컴파일
+            score_rules, caption_words = self._build_image_match_rules(caption, te_variants, page_num, image_id)
+            keyword_re = self._build_keyword_match_re(caption, te_variants[:3])
+            
+            # 1단계: 정확한 매칭 (2단계 키워드 매칭 대상도 같은 순회에서 함께 수집)
             best_match = None
             best_score = 0
             
-            for file_name in all_files:
-                score = self._calculate_comprehensive_image_match_score(
-                    file_name, caption, te_number, page_num, image_id
-                )
-                
+            scores, keyword_indices = self._score_image_files(
+                [file_name_lower for _, file_name_lower in file_entries], score_rules, caption_words, keyword_re
+            )
+            
+            for (file_name, _), score in zip(file_entries, scores):
                 if score > best_score:
                     best_score = score
                     best_match = file_name
@@ -3902,22 +4257,18 @@ class JSONValidatorGUI:
                 if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode and score > 0:
                     print(f"  파일 매칭: {file_name} -> 점수: {score}")
             
+            # 파일 목록은 scandir에서 파일만 골라 폴더 mtime으로 검증한 것이므로 os.path.exists 재확인 생략
             if best_match and best_score > 50:  # 임계값 설정
-                matched_path = os.path.join(image_folder, best_match)
-                if os.path.exists(matched_path):
-                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                        print(f"✅ 최고 점수 매칭: {best_match} (점수: {best_score})")
-                    return matched_path
-            
-            # 2단계: 특정 키워드 기반 매칭
-            keyword_matches = self._find_keyword_based_matches(all_files, caption, te_number)
-            if keyword_matches:
-                first_match = keyword_matches[0]
-                matched_path = os.path.join(image_folder, first_match)
-                if os.path.exists(matched_path):
-                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                        print(f"✅ 키워드 기반 매칭: {first_match}")
-                    return matched_path
+                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                    print(f"✅ 최고 점수 매칭: {best_match} (점수: {best_score})")
+                return os.path.join(image_folder, best_match)
+            
+            # 2단계: 특정 키워드 기반 매칭 (파일명 순으로 첫 번째 파일)
+            if keyword_indices:
+                first_match = min(file_entries[idx][0] for idx in keyword_indices)
+                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                    print(f"✅ 키워드 기반 매칭: {first_match}")
+                return os.path.join(image_folder, first_match)
             
             if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
                 print(f"❌ 로컬 이미지 매칭 실패: 적절한 파일을 찾을 수 없음")
@@ -3932,103 +4283,69 @@ class JSONValidatorGUI:
             return None
 
 
-    def _find_keyword_based_matches(self, all_files, caption, te_number):
+    def _build_keyword_match_re(self, caption, te_variants):
         """
-        키워드 기반으로 매칭되는 파일들을 찾음
+        키워드 기반 매칭에 사용할 정규식을 생성
         
         Args:
-            all_files (list): 모든 파일 목록
             caption (str): 캡션
-            te_number (str): TE 번호
+            te_variants (tuple): 소문자 TE 번호 변형 목록
             
         Returns:
-            list: 매칭된 파일들의 목록
+            re.Pattern: 모든 키워드를 묶은 정규식, 키워드가 없으면 None
         """
-        matches = []
         caption_lower = caption.lower() if caption else ''
+        keywords = list(te_variants)
         
-        # 1. Figure 키워드가 있는 경우
+        # Figure 키워드는 캡션에 Figure가 있는 경우에만 사용
         if 'figure' in caption_lower or 'fig' in caption_lower:
-            figure_files = [f for f in all_files if 'figure' in f.lower() or 'fig' in f.lower()]
-            matches.extend(figure_files)
-        
-        # 2. TE 번호가 있는 경우
-        if te_number:
-            te_variants = [
-                te_number.lower(),
-                te_number.replace('.', '_').lower(),
-                te_number.replace('.', '-').lower()
-            ]
-            
-            for variant in te_variants:
-                te_files = [f for f in all_files if variant in f.lower()]
-                matches.extend(te_files)
+            keywords.extend(('figure', 'fig'))
         
-        # 3. 중복 제거 및 정렬
-        unique_matches = list(set(matches))
-        unique_matches.sort()
-        
-        return unique_matches
+        if not keywords:
+            return None
+        return re.compile('|'.join(re.escape(keyword) for keyword in keywords))
 
 
-    def _calculate_comprehensive_image_match_score(self, filename, caption, te_number, page_num, image_id):
+    def _build_image_match_rules(self, caption, te_variants, page_num, image_id):
         """
-        파일명과 이미지 정보 간의 종합적인 매칭 점수를 계산
+        종합 매칭 점수 규칙을 (컴파일된 정규식, 점수) 목록으로 미리 만든다.
+        규칙마다 후보 패턴을 하나의 대안(|) 정규식으로 묶어 파일명당 search 한 번으로 판정한다.
         
         Args:
-            filename (str): 파일명
             caption (str): 이미지 캡션
-            te_number (str): TE 번호
+            te_variants (tuple): 소문자 TE 번호 변형 목록
             page_num (str/int): 페이지 번호
             image_id (str): 이미지 ID
             
         Returns:
-            int: 매칭 점수 (높을수록 좋은 매칭)
+            tuple: (규칙 목록 [(정규식, 점수), ...], 캡션 주요 단어별 등장 횟수 Counter)
         """
-        score = 0
-        filename_lower = filename.lower()
         caption_lower = caption.lower() if caption else ''
+        rule_patterns = []
         
         # 1. TE 번호 매칭 (최고 우선순위, 100점)
-        if te_number:
-            te_variants = [
-                te_number.lower(),
-                te_number.replace('.', '_').lower(),
-                te_number.replace('.', '-').lower(),
-                te_number.replace('te', '').replace('.', '_').lower(),
-                te_number.replace('te', '').replace('.', '').lower()
-            ]
-            
-            for te_variant in te_variants:
-                if te_variant in filename_lower:
-                    score += 100
-                    break
+        rule_patterns.append((te_variants, 100))
         
         # 2. 이미지 ID 매칭 (90점)
-        if image_id and image_id.lower() in filename_lower:
-            score += 90
+        if image_id:
+            rule_patterns.append(([image_id.lower()], 90))
         
         # 3. Figure 번호 정확한 매칭 (85점)
         figure_match = re.search(r'figure\s*(\d+)', caption_lower)
         if figure_match:
             fig_num = figure_match.group(1)
-            figure_patterns = [
+            rule_patterns.append(([
                 f'figure{fig_num}',
                 f'fig{fig_num}',
                 f'figure_{fig_num}',
                 f'fig_{fig_num}',
                 f'figure-{fig_num}',
                 f'fig-{fig_num}'
-            ]
-            
-            for pattern in figure_patterns:
-                if pattern in filename_lower:
-                    score += 85
-                    break
+            ], 85))
         
         # 4. 페이지 번호 매칭 (70점)
         if page_num and str(page_num) != 'Unknown':
-            page_patterns = [
+            rule_patterns.append(([
                 f'page{page_num}',
                 f'p{page_num}',
                 f'page_{page_num}',
@@ -4037,46 +4354,93 @@ class JSONValidatorGUI:
                 f'p-{page_num}',
                 f'_{page_num}_',
                 f'-{page_num}-'
-            ]
-            
-            for pattern in page_patterns:
-                if pattern in filename_lower:
-                    score += 70
-                    break
+            ], 70))
         
-        # 5. Figure/Fig 키워드 매칭 (60점)
-        figure_keywords = ['figure', 'fig']
-        for keyword in figure_keywords:
-            if keyword in filename_lower and keyword in caption_lower:
-                score += 60
-                break
-        
-        # 6. 캡션 주요 단어 매칭 (각각 30점, 최대 90점)
-        if caption:
-            caption_words = [word for word in caption_lower.split() if len(word) > 3]
-            matched_words = 0
-            for word in caption_words:
-                if word in filename_lower:
-                    score += 30
-                    matched_words += 1
-                    if matched_words >= 3:  # 최대 3개 단어까지만
-                        break
+        # 5. Figure/Fig 키워드 매칭 (60점) - 캡션에 있는 키워드만 대상
+        rule_patterns.append(([keyword for keyword in ('figure', 'fig') if keyword in caption_lower], 60))
         
         # 7. 일반 이미지 키워드 매칭 (20점)
-        image_keywords = ['image', 'img', 'picture', 'pic']
-        for keyword in image_keywords:
-            if keyword in filename_lower:
-                score += 20
-                break
+        rule_patterns.append((['image', 'img', 'picture', 'pic'], 20))
+        
+        score_rules = [
+            (re.compile('|'.join(re.escape(pattern) for pattern in patterns)), weight)
+            for patterns, weight in rule_patterns if patterns
+        ]
         
         # 8. 파일 확장자 우선순위 (10점)
-        preferred_extensions = ['.png', '.jpg', '.jpeg']
-        for ext in preferred_extensions:
-            if filename_lower.endswith(ext):
-                score += 10
-                break
+        score_rules.append((_PREFERRED_EXT_RE, 10))
         
-        return score
+        # 6. 캡션 주요 단어 (각각 30점, 최대 90점) - 같은 단어는 한 번만 검사하고 등장 횟수만큼 점수 반영
+        caption_words = Counter(word for word in caption_lower.split() if len(word) > 3)
+        
+        return score_rules, caption_words
+
+
+    def _score_image_files(self, names_lower, score_rules, caption_words, keyword_re=None):
+        """
+        모든 파일명의 종합 매칭 점수를 한 번에 계산
+        
+        파일명을 줄바꿈으로 이어 붙인 하나의 버퍼에서 규칙마다 정규식을 돌리고,
+        매칭 위치를 파일 인덱스로 환산한다. 파일명에는 줄바꿈이 없으므로 매칭이
+        파일 경계를 넘지 않으며, 한 파일에서 매칭되면 다음 파일 시작 위치부터 다시 찾는다.
+        
+        Args:
+            names_lower (list): 소문자로 변환된 파일명 목록
+            score_rules (list): _build_image_match_rules가 만든 (정규식, 점수) 목록
+            caption_words (Counter): 캡션 주요 단어별 등장 횟수
+            keyword_re (re.Pattern): 키워드 기반 매칭 정규식 (선택사항)
+            
+        Returns:
+            tuple: (파일별 매칭 점수 목록, 키워드가 포함된 파일 인덱스 목록)
+        """
+        file_count = len(names_lower)
+        scores = [0] * file_count
+        if not file_count:
+            return scores, []
+        
+        joined = '\n'.join(names_lower)
+        starts = []
+        offset = 0
+        for name in names_lower:
+            starts.append(offset)
+            offset += len(name) + 1
+        starts.append(offset)
+        
+        def matched_indices(pattern):
+            pos = 0
+            while True:
+                match = pattern.search(joined, pos)
+                if not match:
+                    return
+                idx = bisect_right(starts, match.start()) - 1
+                yield idx
+                pos = starts[idx + 1]
+        
+        def word_indices(word):
+            pos = joined.find(word)
+            while pos != -1:
+                idx = bisect_right(starts, pos) - 1
+                yield idx
+                pos = joined.find(word, starts[idx + 1])
+        
+        for pattern, weight in score_rules:
+            for idx in matched_indices(pattern):
+                scores[idx] += weight
+        
+        # 캡션 주요 단어 매칭 (각각 30점, 파일당 최대 3개 단어까지만)
+        # 단순 부분 문자열 검사이므로 정규식 대신 str.find 사용
+        if caption_words:
+            word_hits = [0] * file_count
+            for word, count in caption_words.items():
+                for idx in word_indices(word):
+                    word_hits[idx] += count
+            for idx, hits in enumerate(word_hits):
+                if hits:
+                    scores[idx] += 30 * min(hits, 3)
+        
+        keyword_indices = list(matched_indices(keyword_re)) if keyword_re else []
+        
+        return scores, keyword_indices
 
 
     def _show_test_result_popup(self, te_number):
@@ -4127,32 +4491,29 @@ class JSONValidatorGUI:
             image_file = None
             supported_extensions = (".png", ".jpg", ".jpeg")
             
-            # 파일 이름에서 사용할 패턴 정의 (유연하게 매칭)
-            suffix_pattern = r'(시험\s*결과\s*[_]*\s*판정\s*[_]*\s*근거|시험결과[_]*판정[_]*근거)'
+            # 파일 이름 패턴은 TE 번호별로 한 번만 컴파일 (구분자 '_' 유무와 확장자를 하나의 정규식으로 처리)
+            pattern = self._table_image_re_cache.get(te_number_formatted)
+            if pattern is None:
+                pattern = re.compile(
+                    rf'^Table_\d+-\d+_{re.escape(te_number_formatted)}_?{_TABLE_IMAGE_SUFFIX}\.(?:png|jpg|jpeg)'
+                )
+                self._table_image_re_cache[te_number_formatted] = pattern
+            
+            if self.validator.debug_mode:
+                print(f"패턴: {pattern.pattern}")
             
             # 매칭된 파일 목록 저장
             matching_files = []
             
-            # 모든 파일을 검색하여 매칭되는 파일 목록 생성
-            for file_name in os.listdir(image_folder):
-                file_name_lower = file_name.lower()
-                for ext in supported_extensions:
-                    # ext 이스케이프 처리
-                    escaped_ext = re.escape(ext)
-                    # 파일 이름에서 TE 번호 부분 추출
-                    pattern = rf'^Table_\d+-\d+_{te_number_formatted}_{suffix_pattern}{escaped_ext}'
-                    pattern_no_underscore = rf'^Table_\d+-\d+_{te_number_formatted}{suffix_pattern}{escaped_ext}'
-                    
+            # 모든 이미지 파일을 검색하여 매칭되는 파일 목록 생성 (시작 시 미리 읽어 둔 폴더 캐시 사용)
+            for file_name, file_name_lower in _scan_image_folder(image_folder):
+                if self.validator.debug_mode:
+                    print(f"파일 이름: {file_name}")
+                
+                if pattern.match(file_name) or pattern.match(file_name_lower):
+                    matching_files.append((file_name, os.path.join(image_folder, file_name)))
                     if self.validator.debug_mode:
-                        print(f"파일 이름: {file_name}")
-                        print(f"패턴: {pattern}")
-                    
-                    if (re.match(pattern, file_name) or re.match(pattern_no_underscore, file_name) or
-                        re.match(pattern, file_name_lower) or re.match(pattern_no_underscore, file_name_lower)):
-                        full_path = os.path.join(image_folder, file_name)
-                        matching_files.append((file_name, full_path))
-                        if self.validator.debug_mode:
-                            print(f"매칭 성공: {file_name}")
+                        print(f"매칭 성공: {file_name}")
             
             # 디버깅: 매칭된 파일 목록 출력
             if self.validator.debug_mode:
@@ -4251,15 +4612,93 @@ class JSONValidatorGUI:
                 import traceback
                 traceback.print_exc()
 
+    def _get_pdf_styles(self):
+        """
+        PDF 저장용 한글 폰트 등록과 문단 스타일 생성을 처음 한 번만 수행
+        
+        Returns:
+            StyleSheet1: 한글 스타일이 추가된 스타일 시트, 폰트를 찾지 못하면 None
+        """
+        if hasattr(self, '_pdf_styles'):
+            return self._pdf_styles
+        
+        pdf_mods = _load_pdf_modules()
+        ParagraphStyle = pdf_mods.ParagraphStyle
+        
+        # 폰트 파일 동적 검색
+        possible_font_paths = [
+            r"C:\Windows\Fonts\malgun.ttf",
+            r"C:\Windows\Fonts\malgunbd.ttf",
+            "/usr/share/fonts/truetype/malgun/malgun.ttf",
+            "/usr/share/fonts/noto/NotoSerifCJK-Regular.ttc"
+        ]
+        font_path = None
+        for path in possible_font_paths:
+            if os.path.exists(path):
+                font_path = path
+                break
+        
+        if not font_path:
+            return None
+        pdf_mods.pdfmetrics.registerFont(pdf_mods.TTFont('MalgunGothic', font_path))
+        
+        styles = pdf_mods.getSampleStyleSheet()
+        styles.add(ParagraphStyle(name='Korean', fontName='MalgunGothic', fontSize=12, leading=14, encoding='utf-8', wordWrap='CJK'))
+        styles.add(ParagraphStyle(name='KoreanTitle', fontName='MalgunGothic', fontSize=18, leading=20, encoding='utf-8'))
+        styles.add(ParagraphStyle(name='KoreanHeading', fontName='MalgunGothic', fontSize=14, leading=16, encoding='utf-8'))
+        styles.add(ParagraphStyle(name='KoreanContent', fontName='MalgunGothic', fontSize=10, leading=12, encoding='utf-8', wordWrap='CJK'))
+        self._pdf_styles = styles
+        return styles
+
+    def _build_pdf_in_background(self, doc, elements, pdf_path):
+        """
+        PDF 문서 빌드를 작업 스레드에서 실행하고 완료 여부를 주기적으로 확인
+        
+        Args:
+            doc (SimpleDocTemplate): PDF 문서 템플릿
+            elements (list): 문서 구성 요소 목록
+            pdf_path (str): 저장 경로
+        """
+        result = {}
+        
+        def build():
+            try:
+                doc.build(elements)
+            except Exception as e:
+                result['error'] = e
+        
+        thread = threading.Thread(target=build, daemon=True)
+        thread.start()
+        self.root.after(200, self._poll_pdf_done, thread, pdf_path, result)
+
+    def _poll_pdf_done(self, thread, pdf_path, result):
+        """
+        PDF 빌드 스레드가 끝나면 메인 스레드에서 결과를 알림
+        
+        Args:
+            thread (threading.Thread): PDF 빌드 스레드
+            pdf_path (str): 저장 경로
+            result (dict): 스레드에서 발생한 예외를 담는 딕셔너리
+        """
+        if thread.is_alive():
+            self.root.after(200, self._poll_pdf_done, thread, pdf_path, result)
+            return
+        
+        error = result.get('error')
+        if error is None:
+            messagebox.showinfo("성공", f"검증 결과가 PDF로 저장되었습니다: {pdf_path}")
+        elif isinstance(error, PermissionError):
+            messagebox.showerror("오류", f"파일 쓰기 권한 오류: {str(error)}\n"
+                                        "PDF 파일이 다른 프로그램에서 열려 있거나 디렉토리에 쓰기 권한이 없습니다.\n"
+                                        "파일을 닫고 디렉토리 권한을 확인한 후 다시 시도해주세요.")
+        else:
+            messagebox.showerror("오류", f"PDF 저장 중 오류 발생: {str(error)}")
+
     def save_results_to_pdf(self):
         """검증 결과를 PDF 문서로 저장"""
-        from reportlab.lib.pagesizes import A4
-        from reportlab.lib.units import cm
-        from reportlab.pdfgen import canvas
-        from reportlab.pdfbase import pdfmetrics
-        from reportlab.pdfbase.ttfonts import TTFont
-        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        pdf_mods = _load_pdf_modules()
+        A4, cm = pdf_mods.A4, pdf_mods.cm
+        SimpleDocTemplate, Paragraph, Spacer = pdf_mods.SimpleDocTemplate, pdf_mods.Paragraph, pdf_mods.Spacer
 
         if not self.found_paths and not self.not_found_text.get("1.0", tk.END).strip():
             messagebox.showwarning("알림", "저장할 검증 결과가 없습니다. 먼저 검증을 실행해주세요.")
@@ -4280,34 +4719,16 @@ class JSONValidatorGUI:
                                             "다른 경로를 선택하거나 디렉토리 권한을 확인해주세요.")
                 return
 
-            doc = SimpleDocTemplate(pdf_path, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm,
-                                    topMargin=2*cm, bottomMargin=2*cm)
-            styles = getSampleStyleSheet()
-            styles.add(ParagraphStyle(name='Korean', fontName='MalgunGothic', fontSize=12, leading=14, encoding='utf-8', wordWrap='CJK'))
-            styles.add(ParagraphStyle(name='KoreanTitle', fontName='MalgunGothic', fontSize=18, leading=20, encoding='utf-8'))
-            styles.add(ParagraphStyle(name='KoreanHeading', fontName='MalgunGothic', fontSize=14, leading=16, encoding='utf-8'))
-            styles.add(ParagraphStyle(name='KoreanContent', fontName='MalgunGothic', fontSize=10, leading=12, encoding='utf-8', wordWrap='CJK'))
-
-            # 폰트 파일 동적 검색
-            possible_font_paths = [
-                r"C:\Windows\Fonts\malgun.ttf",
-                r"C:\Windows\Fonts\malgunbd.ttf",
-                "/usr/share/fonts/truetype/malgun/malgun.ttf",
-                "/usr/share/fonts/noto/NotoSerifCJK-Regular.ttc"
-            ]
-            font_path = None
-            for path in possible_font_paths:
-                if os.path.exists(path):
-                    font_path = path
-                    break
-            
-            if font_path:
-                pdfmetrics.registerFont(TTFont('MalgunGothic', font_path))
-            else:
+            # 폰트 등록과 스타일 생성은 첫 저장 시에만 수행
+            styles = self._get_pdf_styles()
+            if styles is None:
                 messagebox.showerror("오류", "맑은 고딕 폰트(malgun.ttf)를 찾을 수 없습니다.\n"
                                             "시스템에 맑은 고딕 또는 Noto Serif CJK 폰트를 설치해주세요.")
                 return
 
+            doc = SimpleDocTemplate(pdf_path, pagesize=A4, rightMargin=2*cm, leftMargin=2*cm,
+                                    topMargin=2*cm, bottomMargin=2*cm)
+
             elements = []
             title = "Machine Readable 시험결과보고서 변환 및 판정 검증 결과"
             elements.append(Paragraph(title, styles['KoreanTitle']))
@@ -4322,7 +4743,7 @@ class JSONValidatorGUI:
             elements.append(Paragraph(summary_text, styles['Korean']))
 
             pdf_file = f"<b>PDF 파일:</b> {self.pdf_file_path.get() or '미지정'}"
-            elements.append(Paragraph(json_file, styles['Korean']))
+            elements.append(Paragraph(pdf_file, styles['Korean']))
             
             json_file = f"<b>JSON 파일:</b> {self.json_file_path.get() or '미지정'}"
             elements.append(Paragraph(json_file, styles['Korean']))
@@ -4358,8 +4779,9 @@ class JSONValidatorGUI:
                     item_text = f"- {value}"
                     elements.append(Paragraph(item_text, styles['Korean']))
 
-            doc.build(elements)
-            messagebox.showinfo("성공", f"검증 결과가 PDF로 저장되었습니다: {pdf_path}")
+            # 문서 빌드와 파일 쓰기는 작업 스레드에서 수행하여 GUI가 멈추지 않도록 함
+            # (Tk 위젯 값은 위에서 메인 스레드가 모두 읽어 둠)
+            self._build_pdf_in_background(doc, elements, pdf_path)
 
         except PermissionError as e:
             messagebox.showerror("오류", f"파일 쓰기 권한 오류: {str(e)}\n"
@@ -4376,6 +4798,7 @@ class JSONValidatorGUI:
         TE 번호에 해당하는 '시험요구사항'부터 '판정근거'까지의 텍스트, 표, Figure 데이터를 추출
         항상 3개 요소의 리스트를 반환하도록 보장
         """
+        debug = getattr(self.validator, 'debug_mode', False)
         try:
             if not self.validator.json_data:
                 return [f"JSON 데이터가 로드되지 않았습니다 (TE: {te_number})", [], []]
@@ -4383,11 +4806,17 @@ class JSONValidatorGUI:
             text_content = []
             tables_content = []
             figures_content = []
-            judgment_pattern = r'판정\s*근거'
-            te_variants = [te_number, te_number.replace('.', '_'), te_number.replace('.', '-')]
-            other_te_pattern = r'TE\d+\.\d+\.\d+(?<!' + re.escape(te_number) + ')'
-            
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+            # 페이지 구간을 한 번 훑으면서 세 목록에 바로 추가 (append 메서드는 미리 바인딩)
+            add_text = text_content.append
+            add_table = tables_content.append
+            add_figure = figures_content.append
+            # 반복 비교되는 TE 표기 변형 (인터닝한 튜플, TE 번호별 캐시)
+            te_variants = _te_variants(te_number)
+            te_any_re = _te_any_re(te_number)
+            # 캡션/셀/파일 경로처럼 짧은 문자열은 정규식 호출 대신 세 번의 부분 문자열 검사로 확인
+            te0, te1, te2 = te_variants
+            
+            if debug:
                 print(f"\n=== _get_test_requirements_to_judgment 호출: TE 번호 = {te_number} ===")
             
             pages = self.validator.json_data.get("pages", [])
@@ -4395,67 +4824,82 @@ class JSONValidatorGUI:
                 return [f"{te_number}에 대한 페이지 데이터가 없습니다.", [], []]
             
             # 1단계: 해당 TE 번호가 있는 모든 페이지 찾기
-            te_pages = []
-            for idx, page in enumerate(pages):
-                if page is None:
-                    continue
-                page_text = page.get("text", "") or ""
-                if any(te in page_text for te in te_variants):
-                    te_pages.append(idx)
+            # 페이지 텍스트와 TE 포함 여부는 여기서 한 번만 구하고 이후 단계에서 재사용
+            page_texts = [None if page is None else (page.get("text", "") or "") for page in pages]
+            te_pages = _find_segments(te_any_re, page_texts)
             
             if not te_pages:
                 return [f"{te_number}에 대한 페이지를 찾을 수 없습니다.", [], []]
+            te_page_set = set(te_pages)
+            
+            # 페이지별 다른 TE 번호 / 판정근거 검색 결과 (2단계와 3단계에서 공유)
+            other_te_by_page = {}
+            judgment_by_page = {}
+            
+            def find_other_te(idx):
+                matches = other_te_by_page.get(idx)
+                if matches is None:
+                    # 후방탐색 없는 TE 패턴으로 찾은 뒤 현재 TE 번호만 걸러 냄 (역추적 없이 선형 검색)
+                    matches = other_te_by_page[idx] = [
+                        m for m in _TE_EXTRACT_RE.findall(page_texts[idx]) if m != te_number
+                    ]
+                return matches
+            
+            def has_judgment(idx):
+                found = judgment_by_page.get(idx)
+                if found is None:
+                    found = judgment_by_page[idx] = bool(_JUDGMENT_RE.search(page_texts[idx]))
+                return found
             
             te_start_page = min(te_pages)
             te_end_page = max(te_pages)
             
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+            if debug:
                 print(f"TE 관련 페이지들: {te_pages}")
                 print(f"TE 시작 페이지: {te_start_page}, TE 종료 페이지: {te_end_page}")
             
             # 2단계: 판정근거 페이지 찾기
             judgment_page_idx = -1
             for idx in range(te_start_page, len(pages)):
-                page = pages[idx]
-                if page is None:
+                if page_texts[idx] is None:
                     continue
                 
-                page_text = page.get("text", "") or ""
-                other_te_matches = re.findall(other_te_pattern, page_text)
+                other_te_matches = find_other_te(idx)
                 if other_te_matches and idx > te_end_page:
-                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                    if debug:
                         print(f"다른 TE 번호 발견으로 검색 중단: 페이지 {idx}, TE={other_te_matches}")
                     break
                 
-                if re.search(judgment_pattern, page_text, re.IGNORECASE):
-                    if any(te in page_text for te in te_variants) or idx <= te_end_page + 2:
+                if has_judgment(idx):
+                    if idx in te_page_set or idx <= te_end_page + 2:
                         judgment_page_idx = idx
-                        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                        if debug:
                             print(f"판정근거 페이지 발견: {judgment_page_idx}")
                         break
             
             if judgment_page_idx == -1:
                 judgment_page_idx = min(te_end_page + 5, len(pages) - 1)
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                if debug:
                     print(f"판정근거 페이지를 찾지 못함, 확장된 종료 페이지: {judgment_page_idx}")
             
             # 3단계: 데이터 수집 - 더 포괄적인 조건 적용
-            pages_to_check = range(te_start_page, min(judgment_page_idx + 1, len(pages)))
+            # 표/이미지까지 살펴보는 것은 TE 시작 페이지부터 판정근거 페이지까지의 구간뿐
+            pages_to_check = pages[te_start_page:judgment_page_idx + 1]
             
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+            if debug:
                 print(f"최종 검색 페이지 범위: {te_start_page}부터 {judgment_page_idx}")
             
-            for page_idx in pages_to_check:
-                if page_idx >= len(pages):
-                    break
-                page = pages[page_idx]
+            for page_idx, page in enumerate(pages_to_check, te_start_page):
                 if not page:
                     continue
                     
-                page_number = page.get("page_number", f"Unknown_{page_idx}")
+                # 페이지 필드는 여기서 한 번만 꺼내 두고, 없는 목록은 새 리스트 대신 빈 튜플로 대체
+                page_number = page["page_number"] if "page_number" in page else f"Unknown_{page_idx}"
+                page_tables = page.get("tables") or ()
+                page_images = page.get("images") or ()
                 
                 # 4단계: 페이지 텍스트 수집
-                page_text = page.get("text", "") or ""
+                page_text = page_texts[page_idx]
                 if page_text:
                     should_include_page_text = False
                     
@@ -4465,139 +4909,136 @@ class JSONValidatorGUI:
                         inclusion_reason = "TE 페이지 범위 내"
                     
                     # 조건 2: 현재 TE 번호가 포함된 텍스트
-                    elif any(te in page_text for te in te_variants):
+                    elif page_idx in te_page_set:
                         should_include_page_text = True
                         inclusion_reason = "TE 번호 포함"
                     
                     # 조건 3: 시험요구사항이 포함된 텍스트
-                    elif '시험요구사항' in page_text.lower():
+                    elif '시험요구사항' in page_text:
                         should_include_page_text = True
                         inclusion_reason = "시험요구사항 포함"
                     
                     # 조건 4: TE 범위에서 +/- 1 페이지까지 확장
                     elif (te_start_page - 1) <= page_idx <= (judgment_page_idx):
                         # 다른 TE 번호가 단독으로 나타나지 않는 경우에만 포함
-                        other_te_matches = [m for m in re.findall(other_te_pattern, page_text) if m not in te_variants]
+                        other_te_matches = [m for m in find_other_te(page_idx) if m not in te_variants]
                         if not other_te_matches:
                             should_include_page_text = True
                             inclusion_reason = "TE 확장 범위 내"
                     
                     if should_include_page_text:
+                        # 줄 단위 분리와 공백 제거는 두 분기 모두 한 번만 수행
+                        stripped_lines = map(str.strip, page_text.split('\n'))
+                        
                         # 판정근거 페이지의 경우 판정근거 관련 텍스트만 추출
-                        if page_idx == judgment_page_idx and re.search(judgment_pattern, page_text, re.IGNORECASE):
+                        if page_idx == judgment_page_idx and has_judgment(page_idx):
                             judgment_lines = []
-                            lines = page_text.split('\n')
                             in_judgment_section = False
                             
-                            for line in lines:
-                                line = line.strip()
-                                if re.search(judgment_pattern, line, re.IGNORECASE):
+                            for line in stripped_lines:
+                                if _JUDGMENT_RE.search(line):
                                     in_judgment_section = True
                                     judgment_lines.append(line)
                                 elif in_judgment_section:
-                                    if re.match(r'^\d+\.\d+\.\d+\s+', line):  # 다른 섹션 시작
+                                    if _SECTION_RE.match(line):  # 다른 섹션 시작
                                         break
                                     if line:
                                         judgment_lines.append(line)
                             
                             if judgment_lines:
-                                text_content.append({
+                                add_text({
                                     "page_number": page_number,
                                     "text": "\n".join(judgment_lines)
                                 })
-                                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                                if debug:
                                     print(f"페이지 텍스트 추가: 페이지 {page_number}, 판정근거 텍스트, 이유={inclusion_reason}")
                         else:
                             # 일반 페이지는 전체 텍스트 포함
-                            lines = [line.strip() for line in page_text.split('\n') if line.strip()]
+                            lines = [line for line in stripped_lines if line]
                             if lines:
-                                text_content.append({
+                                add_text({
                                     "page_number": page_number,
                                     "text": "\n".join(lines)
                                 })
-                                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                                if debug:
                                     print(f"페이지 텍스트 추가: 페이지 {page_number}, 전체 텍스트, 이유={inclusion_reason}")
                     else:
-                        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                        if debug:
                             print(f"페이지 텍스트 제외: 페이지 {page_number}, 포함 조건 불만족")
                 
                 # 5단계: 표 처리
-                for table in page.get("tables", []):
+                for table in page_tables:
                     if table is None:
                         continue
                     
                     caption_raw = table.get("caption")
-                    caption = str(caption_raw or "").strip()
+                    caption = _as_text(caption_raw).strip()
                     cells = table.get("cells", [])
-                    is_judgment_table = any(keyword in caption.lower() for keyword in ['판정근거', '시험결과판정근거'])
-                    is_requirement_table = '시험요구사항' in caption.lower()
-                    
-                    other_te_matches = [m for m in re.findall(other_te_pattern, caption) if m not in te_variants]
-                    cell_texts = []
-                    for cell in cells:
-                        if cell and 'text' in cell:
-                            cell_text = str(cell.get("text") or "")
-                            cell_texts.append(cell_text)
-                            other_te_matches.extend([m for m in re.findall(other_te_pattern, cell_text) if m not in te_variants])
+                    # 한글 키워드는 대소문자가 없으므로 lower() 사본 없이 원문에서 검색
+                    # ('시험결과판정근거'는 '판정근거'에 포함됨)
+                    is_judgment_table = '판정근거' in caption
+                    is_requirement_table = '시험요구사항' in caption
                     
-                    include_table = True
-                    if other_te_matches:
-                        current_te_in_table = (any(te in caption for te in te_variants) or 
-                                            any(any(te in cell_text for te in te_variants) for cell_text in cell_texts))
-                        if not current_te_in_table:
-                            include_table = False
+                    # 이 구간의 페이지는 항상 TE 시작 페이지~판정근거 페이지 범위 안에 있으므로
+                    # 판정근거 표이거나 시험요구사항 표가 아니면 범위 조건으로 포함 대상이 됨
+                    if is_judgment_table:
+                        range_reason = "판정근거 테이블"
+                    elif not is_requirement_table:
+                        range_reason = "TE 페이지 내 테이블" if page_idx in te_page_set else "TE 범위 내 테이블"
+                    else:
+                        range_reason = None
                     
-                    if include_table:
-                        should_include = False
-                        
-                        if any(te in caption for te in te_variants):
-                            should_include = True
-                            inclusion_reason = f"캡션에 TE 번호 포함"
-                        elif page_idx <= judgment_page_idx and is_judgment_table:
-                            should_include = True
-                            inclusion_reason = f"판정근거 테이블"
-                        elif page_idx in te_pages and not is_requirement_table:
-                            should_include = True
-                            inclusion_reason = f"TE 페이지 내 테이블"
-                        elif te_start_page <= page_idx <= judgment_page_idx and not is_requirement_table:
-                            should_include = True
-                            inclusion_reason = f"TE 범위 내 테이블"
-                        elif any(any(te in cell_text for te in te_variants) for cell_text in cell_texts):
+                    # 캡션에 현재 TE 번호가 있으면 셀을 볼 필요 없이 포함
+                    if te0 in caption or te1 in caption or te2 in caption:
+                        should_include = True
+                        inclusion_reason = "캡션에 TE 번호 포함"
+                    else:
+                        # 셀 텍스트는 목록으로 만들지 않고 필요한 만큼만 순회 (현재 TE 번호를 찾으면 중단)
+                        if any(te0 in cell_text or te1 in cell_text or te2 in cell_text
+                               for cell_text in _iter_cell_texts(cells)):
+                            # 현재 TE 번호가 있으면 다른 TE 번호가 있어도 제외하지 않음
                             should_include = True
-                            inclusion_reason = f"셀에 TE 번호 포함"
-                        
-                        if should_include:
-                            table_data = {"page": page_number, "caption": caption, "cells": cells}
-                            tables_content.append(table_data)
-                            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                print(f"표 추가: 페이지 {page_number}, 캡션='{caption[:50]}...', 이유={inclusion_reason}")
+                            inclusion_reason = range_reason or "셀에 TE 번호 포함"
+                        elif range_reason:
+                            # 현재 TE 번호 없이 다른 TE 번호만 있는 표는 제외 (존재 여부만 확인)
+                            # 이 분기의 캡션/셀에는 현재 TE 번호가 없으므로 찾은 TE 번호는 모두 다른 TE 번호
+                            should_include = not (_TE_EXTRACT_RE.search(caption) or
+                                                  any(_TE_EXTRACT_RE.search(cell_text) for cell_text in _iter_cell_texts(cells)))
+                            inclusion_reason = range_reason
+                        else:
+                            should_include = False
+                    
+                    if should_include:
+                        table_data = {"page": page_number, "caption": caption, "cells": cells}
+                        add_table(table_data)
+                        if debug:
+                            print(f"표 추가: 페이지 {page_number}, 캡션='{caption[:50]}...', 이유={inclusion_reason}")
                 
                 # 6단계: Figure 처리
-                for image in page.get("images", []):
+                for image_idx, image in enumerate(page_images):
                     if image is None:
                         continue
                     
                     caption_raw = image.get("caption")
-                    caption = str(caption_raw or "").strip()
+                    caption = _as_text(caption_raw).strip()
                     file_path_raw = image.get("file_path")
-                    file_path = str(file_path_raw or "").lower()
+                    file_path = _as_text(file_path_raw).lower()
+                    caption_has_figure = _FIGURE_RE.search(caption)
+                    current_te_in_figure = (te0 in caption or te1 in caption or te2 in caption or
+                                            te0 in file_path or te1 in file_path or te2 in file_path)
                     
                     is_figure_match = (
-                        any(te in caption for te in te_variants) or 
-                        any(te in file_path for te in te_variants) or
-                        (page_idx >= te_start_page and page_idx <= judgment_page_idx and 'figure' in caption.lower()) or
+                        current_te_in_figure or
+                        (page_idx >= te_start_page and page_idx <= judgment_page_idx and caption_has_figure) or
                         (page_idx >= te_start_page and page_idx <= judgment_page_idx and 'figure' in file_path) or
-                        (page_idx in te_pages and ('figure' in caption.lower() or 'figure' in file_path))
+                        (page_idx in te_page_set and (caption_has_figure or 'figure' in file_path))
                     )
                     
-                    other_te_matches = [m for m in re.findall(other_te_pattern, caption + " " + file_path) if m not in te_variants]
+                    other_te_matches = [m for m in _TE_EXTRACT_RE.findall(caption + " " + file_path) if m not in te_variants]
                     include_figure = True
                     
-                    if other_te_matches:
-                        current_te_in_figure = (any(te in caption for te in te_variants) or 
-                                            any(te in file_path for te in te_variants))
-                        if not current_te_in_figure:
-                            include_figure = False
+                    if other_te_matches and not current_te_in_figure:
+                        include_figure = False
                     
                     if include_figure and is_figure_match:
                         if self._is_test_result_image_strict(image, []):
@@ -4608,27 +5049,23 @@ class JSONValidatorGUI:
                             "caption": caption,
                             "image_id": image.get("image_id", "N/A"),
                             "page_idx": page_idx,
-                            "image_idx": page.get("images", []).index(image),
+                            "image_idx": image_idx,
                         }
                         
-                        image_data_fields = [
-                            'base64', 'file_path', 'src', 'url', 'path', 'filename', 
-                            'image_data', 'data', 'content', 'binary_data'
-                        ]
-                        
-                        for field in image_data_fields:
-                            if field in image and image[field]:
-                                figure_data[field] = image[field]
+                        for field in _FIGURE_DATA_FIELDS:
+                            value = image.get(field)
+                            if value:
+                                figure_data[field] = value
                         
                         if not caption:
                             figure_data["caption"] = self._generate_image_caption(figure_data)
                         
-                        figures_content.append(figure_data)
+                        add_figure(figure_data)
                         
-                        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+                        if debug:
                             print(f"Figure 추가: 페이지 {page_number}, 캡션='{caption}', 파일 경로='{file_path}'")
             
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+            if debug:
                 print(f"\n=== 수집된 데이터 요약 ===")
                 print(f"텍스트 섹션: {len(text_content)}개")
                 print(f"테이블: {len(tables_content)}개")
@@ -4638,416 +5075,13 @@ class JSONValidatorGUI:
             
         except Exception as e:
             error_msg = f"{te_number} 데이터 추출 중 오류 발생: {str(e)}"
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
+            if debug:
                 print(f"_get_test_requirements_to_judgment 오류: {str(e)}")
                 import traceback
                 traceback.print_exc()
             return [error_msg, [], []]
     ##여기까지
 
-    def _get_test_requirements_to_judgment2(self, te_number): ##기존코드 삭제 
-        """
-        TE 번호에 해당하는 '시험요구사항'부터 '판정근거'까지의 텍스트, 표, Figure 데이터를 추출
-        항상 3개 요소의 리스트를 반환하도록 보장
-        
-        Args:
-            te_number (str): TE 번호 (예: "TE02.03.01")
-        
-        Returns:
-            list: [텍스트 섹션, 표 데이터 리스트, Figure 데이터 리스트]
-        """
-        try:
-            if not self.validator.json_data:
-                return [f"JSON 데이터가 로드되지 않았습니다 (TE: {te_number})", [], []]
-            
-            text_content = []
-            tables_content = []
-            figures_content = []
-            judgment_pattern = r'판정\s*근거'
-            te_variants = [te_number, te_number.replace('.', '_'), te_number.replace('.', '-')]
-            other_te_pattern = r'TE\d+\.\d+\.\d+(?<!' + re.escape(te_number) + ')'  # 현재 TE 번호 제외
-            
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                print(f"\n=== _get_test_requirements_to_judgment 호출: TE 번호 = {te_number} ===")
-            
-            pages = self.validator.json_data.get("pages", [])
-            if not pages:
-                return [f"{te_number}에 대한 페이지 데이터가 없습니다.", [], []]
-            
-            # 1단계: 해당 TE 번호가 있는 모든 페이지 찾기
-            te_pages = []
-            for idx, page in enumerate(pages):
-                if page is None:
-                    continue
-                page_text = page.get("text", "")
-                if any(te in page_text for te in te_variants):
-                    te_pages.append(idx)
-            
-            if not te_pages:
-                return [f"{te_number}에 대한 페이지를 찾을 수 없습니다.", [], []]
-            
-            te_start_page = min(te_pages)
-            te_end_page = max(te_pages)
-            
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                print(f"TE 관련 페이지들: {te_pages}")
-                print(f"TE 시작 페이지: {te_start_page}, TE 종료 페이지: {te_end_page}")
-            
-            # 2단계: TE 페이지 이후에서 해당 TE와 관련된 판정근거 페이지 찾기
-            judgment_page_idx = -1
-            
-            # TE 페이지부터 문서 끝까지 검색하되, 다른 TE가 나타나기 전까지만
-            for idx in range(te_start_page, len(pages)):
-                page = pages[idx]
-                if page is None:
-                    continue
-                
-                page_text = page.get("text", "")
-                
-                # 다른 TE 번호가 나타나면 검색 중단 (현재 TE 제외)
-                other_te_matches = re.findall(other_te_pattern, page_text)
-                if other_te_matches and idx > te_end_page:
-                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                        print(f"다른 TE 번호 발견으로 검색 중단: 페이지 {idx}, TE={other_te_matches}")
-                    break
-                
-                # 판정근거 패턴 검색
-                if re.search(judgment_pattern, page_text, re.IGNORECASE):
-                    # 해당 TE와 관련된 판정근거인지 확인
-                    if any(te in page_text for te in te_variants) or idx <= te_end_page + 2:  # TE 페이지 + 여유분 2페이지
-                        judgment_page_idx = idx
-                        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                            print(f"판정근거 페이지 발견: {judgment_page_idx}")
-                        break
-            
-            # 판정근거 페이지가 없으면 TE 종료 페이지 + 5페이지까지 확장
-            if judgment_page_idx == -1:
-                judgment_page_idx = min(te_end_page + 5, len(pages) - 1)
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                    print(f"판정근거 페이지를 찾지 못함, 확장된 종료 페이지: {judgment_page_idx}")
-            
-            # 3단계: TE 시작 페이지부터 판정근거 페이지까지 데이터 수집
-            pages_to_check = range(te_start_page, min(judgment_page_idx + 1, len(pages)))
-            
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                print(f"최종 검색 페이지 범위: {te_start_page}부터 {judgment_page_idx} (총 {len(list(pages_to_check))}개 페이지)")
-            
-            for page_idx in pages_to_check:
-                if page_idx >= len(pages):
-                    break
-                page = pages[page_idx]
-                if not page:
-                    continue
-                    
-                page_number = page.get("page_number", f"Unknown_{page_idx}")
-                
-                # 4단계: 페이지 텍스트 수집
-                page_text = page.get("text", "")
-                if page_text:
-                    # 다른 TE 번호가 포함된 경우 제외 (현재 TE는 허용)
-                    other_te_matches = [m for m in re.findall(other_te_pattern, page_text) if m not in te_variants]
-                    include_text = True
-                    
-                    if other_te_matches and page_idx != te_start_page:
-                        # 현재 TE도 함께 포함된 경우는 허용
-                        current_te_in_text = any(te in page_text for te in te_variants)
-                        if not current_te_in_text:
-                            include_text = False
-                            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                print(f"페이지 텍스트 제외: 페이지 {page_number}, 다른 TE 번호={other_te_matches}")
-                    
-                    if include_text:
-                        if page_idx < judgment_page_idx or (page_idx == judgment_page_idx and not re.search(judgment_pattern, page_text, re.IGNORECASE)):
-                            if any(te in page_text for te in te_variants) or '시험요구사항' in page_text.lower() or page_idx in te_pages:
-                                lines = [line.strip() for line in page_text.split('\n') if line.strip()]
-                                if lines:
-                                    text_content.append(("페이지 텍스트", page_number, "\n".join(lines)))
-                                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                        print(f"텍스트 추가: 페이지 {page_number}, 내용='{lines[0][:50]}...'")
-                        elif page_idx == judgment_page_idx:
-                            lines = [line.strip() for line in page_text.split('\n') if line.strip() and re.search(judgment_pattern, line, re.IGNORECASE)]
-                            if lines:
-                                text_content.append(("페이지 텍스트", page_number, "\n".join(lines)))
-                                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                    print(f"텍스트 추가: 페이지 {page_number}, 판정근거 관련 내용='{lines[0][:50]}...'")
-                
-                # 5단계: 텍스트 블록 수집
-                for text_block in page.get("text_blocks", []):
-                    if text_block and 'text' in text_block:
-                        text = text_block['text'].strip()
-                        if text:
-                            other_te_matches = [m for m in re.findall(other_te_pattern, text) if m not in te_variants]
-                            include_block = True
-                            
-                            if other_te_matches and page_idx != te_start_page:
-                                current_te_in_block = any(te in text for te in te_variants)
-                                if not current_te_in_block:
-                                    include_block = False
-                                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                        print(f"텍스트 블록 제외: 페이지 {page_number}, 다른 TE 번호={other_te_matches}")
-                            
-                            if include_block:
-                                if page_idx < judgment_page_idx or (page_idx == judgment_page_idx and not re.search(judgment_pattern, text, re.IGNORECASE)):
-                                    if any(te in text for te in te_variants) or '시험요구사항' in text.lower() or page_idx in te_pages:
-                                        lines = [line.strip() for line in text.split('\n') if line.strip()]
-                                        if lines:
-                                            text_content.append(("텍스트 블록", page_number, "\n".join(lines)))
-                                            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                                print(f"텍스트 블록 추가: 페이지 {page_number}, 내용='{lines[0][:50]}...'")
-                                elif page_idx == judgment_page_idx:
-                                    if re.search(judgment_pattern, text, re.IGNORECASE):
-                                        lines = [line.strip() for line in text.split('\n') if line.strip()]
-                                        if lines:
-                                            text_content.append(("텍스트 블록", page_number, "\n".join(lines)))
-                                            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                                print(f"텍스트 블록 추가: 페이지 {page_number}, 판정근거 관련 내용='{lines[0][:50]}...'")
-                
-                # 6단계: 표 처리
-                for table in page.get("tables", []):
-                    if table is None:
-                        continue
-                    caption = table.get("caption", "").strip()
-                    cells = table.get("cells", [])
-                    is_judgment_table = any(keyword in caption.lower() for keyword in ['판정근거', '시험결과판정근거'])
-                    is_requirement_table = '시험요구사항' in caption.lower()
-                    
-                    # 다른 TE 번호가 포함된 경우 제외
-                    other_te_matches = [m for m in re.findall(other_te_pattern, caption) if m not in te_variants]
-                    cell_texts = [cell.get("text", "") for cell in cells if cell and 'text' in cell]
-                    for cell_text in cell_texts:
-                        other_te_matches.extend([m for m in re.findall(other_te_pattern, cell_text) if m not in te_variants])
-                    
-                    include_table = True
-                    if other_te_matches:
-                        # 현재 TE도 함께 포함된 경우는 허용
-                        current_te_in_table = (any(te in caption for te in te_variants) or 
-                                            any(any(te in cell_text for te in te_variants) for cell_text in cell_texts))
-                        if not current_te_in_table:
-                            include_table = False
-                            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                print(f"표 제외: 페이지 {page_number}, 캡션='{caption[:50]}...', 다른 TE 번호={other_te_matches}")
-                    
-                    if include_table:
-                        # 테이블 포함 조건을 더 포괄적으로 수정
-                        should_include = False
-                        
-                        # 1. 테이블 캡션에 현재 TE 번호가 포함된 경우
-                        if any(te in caption for te in te_variants):
-                            should_include = True
-                            inclusion_reason = f"캡션에 TE 번호 포함"
-                        
-                        # 2. 판정근거 테이블인 경우 (판정근거 페이지 이전까지)
-                        elif page_idx <= judgment_page_idx and is_judgment_table:
-                            should_include = True
-                            inclusion_reason = f"판정근거 테이블"
-                        
-                        # 3. TE 페이지에 있는 테이블 (시험요구사항 테이블 제외)
-                        elif page_idx in te_pages and not is_requirement_table:
-                            should_include = True
-                            inclusion_reason = f"TE 페이지 내 테이블"
-                        
-                        # 4. TE 시작 페이지와 판정근거 페이지 사이의 모든 테이블 (시험요구사항 제외)
-                        elif te_start_page <= page_idx <= judgment_page_idx and not is_requirement_table:
-                            should_include = True
-                            inclusion_reason = f"TE 범위 내 테이블"
-                        
-                        # 5. 테이블 셀에 현재 TE 번호가 포함된 경우
-                        elif any(any(te in cell_text for te in te_variants) for cell_text in cell_texts):
-                            should_include = True
-                            inclusion_reason = f"셀에 TE 번호 포함"
-                        
-                        if should_include:
-                            table_data = {"page": page_number, "caption": caption, "cells": cells}
-                            tables_content.append(table_data)
-                            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                print(f"표 추가: 페이지 {page_number}, 캡션='{caption[:50]}...', 이유={inclusion_reason}")
-                        else:
-                            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                print(f"표 제외: 페이지 {page_number}, 캡션='{caption[:50]}...', 이유={'시험요구사항' if is_requirement_table else '포함 조건 불만족'}")
-                
-                # 7단계: Figure 처리
-                for image in page.get("images", []):
-                    if image is None:
-                        continue
-                    
-                    caption = image.get("caption", "").strip()
-                    file_path = str(image.get("file_path", "")).lower()
-                    
-                    # Figure 매칭 조건 개선
-                    is_figure_match = (
-                        any(te in caption for te in te_variants) or 
-                        any(te in file_path for te in te_variants) or
-                        (page_idx >= te_start_page and page_idx <= judgment_page_idx and 'figure' in caption.lower()) or
-                        (page_idx >= te_start_page and page_idx <= judgment_page_idx and 'figure' in file_path) or
-                        (page_idx in te_pages and ('figure' in caption.lower() or 'figure' in file_path))
-                    )
-                    
-                    # 다른 TE 번호가 포함된 경우 제외
-                    other_te_matches = [m for m in re.findall(other_te_pattern, caption + " " + file_path) if m not in te_variants]
-                    include_figure = True
-                    
-                    if other_te_matches:
-                        # 현재 TE도 함께 포함된 경우는 허용
-                        current_te_in_figure = (any(te in caption for te in te_variants) or 
-                                            any(te in file_path for te in te_variants))
-                        if not current_te_in_figure:
-                            include_figure = False
-                            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                print(f"Figure 제외: 페이지 {page_number}, 캡션='{caption}', 파일 경로='{file_path}', 다른 TE 번호={other_te_matches}")
-                    
-                    if include_figure and is_figure_match:
-                        # 판정근거 표로 잘못 분류되지 않도록 확인
-                        if self._is_test_result_image_strict(image, []):
-                            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                print(f"Figure 제외: 페이지 {page_number}, 캡션='{caption}', 파일 경로='{file_path}', 이유=판정근거 표")
-                            continue
-                        
-                        figure_data = {
-                            "page": page_number,
-                            "caption": caption,
-                            "image_id": image.get("image_id", "N/A"),
-                            "page_idx": page_idx,
-                            "image_idx": page.get("images", []).index(image),
-                        }
-                        
-                        # 모든 가능한 이미지 데이터 속성 복사
-                        image_data_fields = [
-                            'base64', 'file_path', 'src', 'url', 'path', 'filename', 
-                            'image_data', 'data', 'content', 'binary_data'
-                        ]
-                        
-                        for field in image_data_fields:
-                            if field in image and image[field]:
-                                figure_data[field] = image[field]
-                        
-                        # 캡션이 없으면 동적으로 생성
-                        if not caption:
-                            figure_data["caption"] = self._generate_image_caption(figure_data)
-                        
-                        figures_content.append(figure_data)
-                        
-                        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                            print(f"Figure 추가: 페이지 {page_number}, 캡션='{caption}', 파일 경로='{file_path}', 매칭 조건={is_figure_match}")
-                            print(f"  사용 가능한 속성: {[k for k in image.keys() if image.get(k)]}")
-                            print(f"  복사된 속성: {[k for k in figure_data.keys() if k not in ['page', 'caption', 'image_id', 'page_idx', 'image_idx']]}")
-                    else:
-                        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                            print(f"Figure 제외: 페이지 {page_number}, 캡션='{caption}', 파일 경로='{file_path}', 매칭 조건={is_figure_match}, 포함 여부={include_figure}")
-            
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                print(f"\n=== 수집된 데이터 요약 ===")
-                print(f"텍스트 섹션: {len(text_content)}개")
-                print(f"테이블: {len(tables_content)}개")
-                print(f"Figure: {len(figures_content)}개")
-                for i, fig in enumerate(figures_content):
-                    print(f"  Figure {i+1}: 페이지 {fig['page']}, 캡션='{fig['caption'][:50]}...', 파일 경로='{fig.get('file_path', 'N/A')}'")
-            
-            return [text_content, tables_content, figures_content]
-            
-        except Exception as e:
-            error_msg = f"{te_number} 데이터 추출 중 오류 발생: {str(e)}"
-            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                print(f"_get_test_requirements_to_judgment 오류: {str(e)}")
-                import traceback
-                traceback.print_exc()
-            return [error_msg, [], []]
-
-    def _find_related_te_number_improved(self, img, te_numbers_str):
-        """
-        이미지가 어떤 TE 번호와 관련이 있는지 확인
-        """
-        te_variants = []
-        for te in te_numbers_str:
-            te_variants.append(te)
-            te_variants.append(te.replace('.', '_'))  # TE02.03.01 -> TE02_03_01
-            te_variants.append(te.replace('.', '-'))  # TE02.03.01 -> TE02-03-01
-        
-        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-            print(f"\n=== TE 번호 매칭 시도: 캡션='{img.get('caption', 'N/A')}', 파일 경로='{img.get('file_path', 'N/A')}' ===")
-        
-        # 1. 이미지 자체 속성에서 TE 번호 검색
-        search_fields = [
-            'caption', 'file_path', 'image_id', 'src', 'url', 'alt', 'title',
-            'description', 'name', 'filename', 'path', 'table_caption', 'table_id'
-        ]
-        
-        for field in search_fields:
-            if field in img and img[field]:
-                field_value = str(img[field]).lower()
-                for te_variant in te_variants:
-                    if te_variant.lower() in field_value:
-                        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                            print(f"TE 매칭 성공: 필드={field}, 값={field_value}, TE={te_variant}")
-                        return te_variant.replace('_', '.').replace('-', '.')  # 원래 TE 형식으로 변환
-        
-        # 2. Figure 키워드 포함 시 TE 번호 추정
-        caption = img.get('caption', '').lower()
-        file_path = img.get('file_path', '').lower()
-        if 'figure' in caption or 'figure' in file_path:
-            closest_te = self._find_closest_te_number(img, te_numbers_str)
-            if closest_te:
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                    print(f"TE 매칭 성공: Figure 기반, 추정된 TE={closest_te}, 캡션={caption}, 파일 경로={file_path}")
-                return closest_te
-            else:
-                if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                    print(f"TE 매칭 실패: Figure 포함 but TE 번호 추정 실패, 캡션={caption}, 파일 경로={file_path}")
-                return None
-        
-        # 3. 동일 페이지 및 인접 페이지(±1)에서 TE 번호 검색
-        if 'page_idx' in img:
-            page_idx = img['page_idx']
-            pages_to_check = [page_idx]
-            if page_idx > 0:
-                pages_to_check.append(page_idx - 1)  # 이전 페이지
-            if page_idx < len(self.validator.json_data.get("pages", [])) - 1:
-                pages_to_check.append(page_idx + 1)  # 다음 페이지
-            
-            for check_page_idx in pages_to_check:
-                if check_page_idx < len(self.validator.json_data.get("pages", [])):
-                    page = self.validator.json_data.get("pages", [])[check_page_idx]
-                    
-                    if page:
-                        # 페이지 텍스트에서 TE 번호 검색
-                        page_text = page.get("text", "")
-                        if page_text:
-                            for te_variant in te_variants:
-                                if te_variant in page_text:
-                                    if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                        print(f"TE 매칭 성공: 페이지 {check_page_idx} 텍스트, TE={te_variant}")
-                                    return te_variant.replace('_', '.').replace('-', '.')
-                        
-                        # 텍스트 블록에서 TE 번호 검색
-                        text_blocks = page.get("text_blocks", [])
-                        for text_block in text_blocks:
-                            if text_block and 'text' in text_block:
-                                block_text = text_block['text']
-                                if block_text:
-                                    for te_variant in te_variants:
-                                        if te_variant in block_text:
-                                            if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                                print(f"TE 매칭 성공: 페이지 {check_page_idx} 텍스트 블록, TE={te_variant}")
-                                            return te_variant.replace('_', '.').replace('-', '.')
-                        
-                        # 테이블에서 TE 번호 검색
-                        tables = page.get("tables", [])
-                        for table in tables:
-                            if table:
-                                caption = table.get("caption", "")
-                                cells = table.get("cells", [])
-                                cell_texts = [cell.get("text", "") for cell in cells if cell and 'text' in cell]
-                                
-                                for te_variant in te_variants:
-                                    if (caption and te_variant in caption) or \
-                                    any(te_variant in cell_text for cell_text in cell_texts):
-                                        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-                                            print(f"TE 매칭 성공: 페이지 {check_page_idx} 테이블, TE={te_variant}")
-                                        return te_variant.replace('_', '.').replace('-', '.')
-        
-        if hasattr(self.validator, 'debug_mode') and self.validator.debug_mode:
-            print(f"TE 매칭 실패: 모든 조건 불만족")
-        return None
-
     def debug_figure_data(self, te_number):
         """
         JSONValidatorGUI 클래스에 추가할 Figure 디버깅 메서드
@@ -5059,11 +5093,13 @@ class JSONValidatorGUI:
         
         print(f"\n=== {te_number} Figure 데이터 디버깅 ===")
         
-        te_variants = [te_number, te_number.replace('.', '_'), te_number.replace('.', '-')]
+        # TE 변형 검색 정규식과 페이지 목록은 루프 밖에서 한 번만 준비
+        te_any_re = _te_any_re(te_number)
+        pages = self.validator.json_data.get("pages", [])
         found_images = []
         debug_info = []
         
-        for page_idx, page in enumerate(self.validator.json_data.get("pages", [])):
+        for page_idx, page in enumerate(pages):
             if page is None:
                 continue
             
@@ -5071,7 +5107,7 @@ class JSONValidatorGUI:
             page_text = page.get("text", "")
             
             # TE 번호가 페이지에 있는지 확인
-            has_te = any(te in page_text for te in te_variants)
+            has_te = bool(te_any_re.search(page_text))
             
             images = page.get("images", [])
             if images:
@@ -5085,7 +5121,7 @@ class JSONValidatorGUI:
                     
                     caption = image.get("caption", "").strip()
                     is_figure = 'figure' in caption.lower()
-                    is_te_match = any(te in caption for te in te_variants)
+                    is_te_match = bool(te_any_re.search(caption))
                     is_figure_match = is_figure and (has_te or is_te_match)
                     
                     img_info = f"  이미지 {img_idx}: '{caption}' (Figure={is_figure}, 매칭={is_figure_match})"
@@ -5133,15 +5169,16 @@ class JSONValidatorGUI:
         
         try:
             all_files = os.listdir(output_dir)
-            image_files = [f for f in all_files 
-                        if any(f.lower().endswith(ext) for ext in ['.png', '.jpg', '.jpeg', '.bmp', '.gif'])]
+            # 소문자 파일명은 한 번만 만들어 확장자/키워드 검사에 재사용
+            image_files = [(f, f_lower) for f, f_lower in zip(all_files, map(str.lower, all_files))
+                           if f_lower.endswith(_IMAGE_EXTENSIONS)]
             
             info_lines.append(f"전체 파일 수: {len(all_files)}")
             info_lines.append(f"이미지 파일 수: {len(image_files)}")
             
-            # Figure 관련 파일들 찾기
-            figure_files = [f for f in image_files if 'figure' in f.lower() or 'fig' in f.lower()]
-            page_files = [f for f in image_files if 'page' in f.lower()]
+            # Figure 관련 파일들 찾기 ('figure'는 'fig'를 포함)
+            figure_files = [f for f, f_lower in image_files if 'fig' in f_lower]
+            page_files = [f for f, f_lower in image_files if 'page' in f_lower]
             
             info_lines.append(f"Figure 관련 파일: {len(figure_files)}개")
             info_lines.append(f"페이지 관련 파일: {len(page_files)}개")
@@ -5208,7 +5245,7 @@ class JSONValidatorGUI:
 class ImageViewerPopup:
     """이미지를 표시하는 팝업 창 (캡션 표시 기능 추가, 로컬 파일 우선 로드)"""
     
-    def __init__(self, parent, title, image_data):
+    def __init__(self, parent, title, image_data, validator=None):
         """
         팝업 창 초기화
         
@@ -5216,6 +5253,7 @@ class ImageViewerPopup:
             parent (tk.Tk): 부모 창
             title (str): 팝업 창 제목
             image_data (dict): 이미지 데이터 (base64 또는 경로)
+            validator (JSONValidator): JSON 검증기 객체 (선택사항, 디버그 출력 여부 확인용)
         """
         self.top = tk.Toplevel(parent)
         self.top.title(title)
@@ -5224,6 +5262,7 @@ class ImageViewerPopup:
         
         # 이미지 데이터 저장 (캡션 표시용)
         self.image_data = image_data
+        self.validator = validator
         
         screen_width = parent.winfo_screenwidth()
         screen_height = parent.winfo_screenheight()
@@ -5239,6 +5278,13 @@ class ImageViewerPopup:
         self.photo = None
         self.image_id = None
         self.zoom_level = 1.0
+        # 확대/축소 결과 캐시 (줌 단계 -> (LANCZOS PhotoImage, 픽셀 수), 최근 사용 순)와 고화질 재렌더링 예약 핸들
+        self._zoom_cache = OrderedDict()
+        self._zoom_cache_pixels = 0
+        self._hq_render_job = None
+        # 아직 반영하지 않은 마우스 휠 확대/축소 단계 수와 반영 예약 여부
+        self._zoom_accum = 0
+        self._zoom_pending = False
         
         self._create_image_view(image_data)
         self._create_close_button()
@@ -5373,6 +5419,8 @@ class ImageViewerPopup:
         image = None
         self.original_image = None
         self.zoom_level = 1.0
+        self._zoom_cache.clear()
+        self._zoom_cache_pixels = 0
         image_loaded = False
         
         try:
@@ -5393,27 +5441,20 @@ class ImageViewerPopup:
                 # 2. 기존 파일 경로에서 이미지 로드 (우선순위 2)
                 if not image_loaded:
                     for path_field in ['file_path', 'src', 'url']:
-                        if path_field in image_data and image_data[path_field]:
-                            file_path = image_data[path_field]
-                            if os.path.exists(file_path):
-                                try:
-                                    image = Image.open(file_path)
-                                    image_loaded = True
-                                    print(f"✅ 기존 경로 이미지 로드 성공: {os.path.basename(file_path)}")
-                                    break
-                                except Exception as e:
-                                    print(f"❌ 기존 경로 이미지 로드 실패: {file_path}, 오류: {str(e)}")
+                        file_path = image_data.get(path_field)
+                        if not file_path:
+                            continue
+                        image = _try_open_image(file_path)
+                        if image is not None:
+                            image_loaded = True
+                            print(f"✅ 기존 경로 이미지 로드 성공: {os.path.basename(file_path)}")
+                            break
+                        print(f"❌ 기존 경로 이미지 로드 실패: {file_path}")
                 
                 # 3. base64 데이터에서 이미지 로드 (fallback)
                 if not image_loaded and 'base64' in image_data and image_data['base64']:
                     try:
-                        base64_data = image_data['base64']
-                        if base64_data.startswith('data:image'):
-                            base64_parts = base64_data.split(',', 1)
-                            if len(base64_parts) > 1:
-                                base64_data = base64_parts[1]
-                        image_bytes = base64.b64decode(base64_data)
-                        image = Image.open(BytesIO(image_bytes))
+                        image = _open_base64_image(image_data['base64'])
                         image_loaded = True
                         print(f"✅ base64 이미지 로드 성공 (fallback)")
                     except Exception as e:
@@ -5431,12 +5472,11 @@ class ImageViewerPopup:
                 screen_height = self.top.winfo_screenheight() * 0.7
                 
                 if orig_width > screen_width or orig_height > screen_height:
-                    width_ratio = screen_width / orig_width
-                    height_ratio = screen_height / orig_height
-                    ratio = min(width_ratio, height_ratio)
-                    new_width = int(orig_width * ratio)
-                    new_height = int(orig_height * ratio)
-                    image = image.resize((new_width, new_height), Image.LANCZOS)
+                    # 화면 맞춤 미리보기는 원본에서 바로 resize (resize는 새 이미지를 반환하므로 원본은 확대/축소용으로 유지)
+                    # reducing_gap으로 큰 축소는 reduce로 먼저 줄인 뒤 LANCZOS 리샘플링
+                    ratio = min(screen_width / orig_width, screen_height / orig_height)
+                    fit_size = (int(orig_width * ratio), int(orig_height * ratio))
+                    image = image.resize(fit_size, Image.LANCZOS, reducing_gap=2.0)
                     self.zoom_level = ratio
                 
                 self.photo = ImageTk.PhotoImage(image)
@@ -5484,13 +5524,9 @@ class ImageViewerPopup:
                 print(f"extracted_images 폴더가 존재하지 않음: {image_folder}")
                 return None
             
-            # 지원되는 이미지 확장자
-            supported_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif']
-            
-            # 폴더 내 파일 목록 가져오기
+            # 폴더 내 (파일명, 소문자 파일명) 목록 가져오기 (팝업 간에 폴더 mtime 기준으로 캐시 공유)
             try:
-                all_files = [f for f in os.listdir(image_folder) 
-                           if any(f.lower().endswith(ext) for ext in supported_extensions)]
+                all_files = _scan_image_folder(image_folder)
             except Exception as e:
                 print(f"폴더 읽기 오류: {image_folder}, 오류: {str(e)}")
                 return None
@@ -5506,37 +5542,56 @@ class ImageViewerPopup:
             
             print(f"로컬 이미지 검색: 캡션='{caption}', TE={te_number}, 페이지={page_num}")
             
-            # 1단계: 정확한 매칭
-            best_match = None
-            best_score = 0
-            
-            for file_name in all_files:
-                score = self._calculate_image_match_score(file_name, caption, te_number, page_num)
-                
-                if score > best_score:
-                    best_score = score
-                    best_match = file_name
+            # 파일마다 다시 만들지 않도록 TE 변형과 소문자 캡션/캡션 주요 단어(3글자 초과)는 한 번만 생성
+            te_variants = _te_filename_variants(te_number)
+            caption_lower = caption.lower()
+            caption_words = [word for word in caption_lower.split() if len(word) > 3]
+            # 파일별 채점 로그는 디버그 모드에서만 출력
+            debug = hasattr(self.validator, 'debug_mode') and self.validator.debug_mode
+            
+            def best_of(indices):
+                best_match = None
+                best_score = 0
+                for idx in indices:
+                    file_name, file_name_lower = all_files[idx]
+                    score = self._calculate_image_match_score(
+                        file_name_lower, caption_lower, caption_words, te_variants, page_num, debug)
                     
-                if score > 0:
-                    print(f"  파일 매칭: {file_name} -> 점수: {score}")
+                    if score > best_score:
+                        best_score = score
+                        best_match = file_name
+                        
+                    if debug and score > 0:
+                        print(f"  파일 매칭: {file_name} -> 점수: {score}")
+                return best_match, best_score
             
+            # 1단계: 정확한 매칭
+            # TE 번호가 들어 있는 파일만 먼저 채점하고, TE 번호가 없는 파일이 받을 수 있는
+            # 최대 점수가 그보다 낮을 때만 나머지 채점을 생략 (전체 채점과 같은 결과)
+            te_indices = []
+            if te_variants:
+                te_re = re.compile('|'.join(re.escape(te_variant) for te_variant in te_variants))
+                te_indices = _find_segments(te_re, [file_name_lower for _, file_name_lower in all_files])
+            
+            best_match, best_score = best_of(te_indices)
+            if not te_indices or self._max_image_match_score_without_te(caption_lower, caption_words, page_num) >= best_score:
+                best_match, best_score = best_of(range(len(all_files)))
+            
+            # 목록의 파일은 scandir로 확인된 것이므로 os.path.exists 재확인 없이 경로를 반환
+            # (파일이 그 사이 사라졌다면 이미지를 여는 단계에서 처리됨)
             if best_match and best_score > 30:  # 임계값 설정
-                matched_path = os.path.join(image_folder, best_match)
-                if os.path.exists(matched_path):
-                    print(f"✅ 로컬 이미지 매칭 성공: {best_match} (점수: {best_score})")
-                    return matched_path
+                print(f"✅ 로컬 이미지 매칭 성공: {best_match} (점수: {best_score})")
+                return os.path.join(image_folder, best_match)
             
             # 2단계: Figure 키워드 기반 매칭
-            if 'figure' in caption.lower() or 'fig' in caption.lower():
-                figure_files = [f for f in all_files if 'figure' in f.lower() or 'fig' in f.lower()]
-                figure_files.sort()
+            if 'figure' in caption_lower or 'fig' in caption_lower:
+                # 'figure'는 'fig'를 포함하므로 'fig'만 확인, 정렬 대신 가장 앞선 파일명만 선택
+                figure_files = [f for f, f_lower in all_files if 'fig' in f_lower]
                 
                 if figure_files:
-                    fallback_file = figure_files[0]  # 첫 번째 Figure 파일 사용
-                    fallback_path = os.path.join(image_folder, fallback_file)
-                    if os.path.exists(fallback_path):
-                        print(f"✅ Figure 키워드 매칭: {fallback_file}")
-                        return fallback_path
+                    fallback_file = min(figure_files)  # 첫 번째 Figure 파일 사용
+                    print(f"✅ Figure 키워드 매칭: {fallback_file}")
+                    return os.path.join(image_folder, fallback_file)
             
             print(f"❌ 로컬 이미지 매칭 실패: 적절한 파일을 찾을 수 없음")
             return None
@@ -5547,44 +5602,62 @@ class ImageViewerPopup:
             traceback.print_exc()
             return None
 
-    def _calculate_image_match_score(self, filename, caption, te_number, page_num):
+    def _max_image_match_score_without_te(self, caption_lower, caption_words, page_num):
+        """
+        TE 번호가 없는 파일이 _calculate_image_match_score에서 받을 수 있는 최대 점수
+        
+        Args:
+            caption_lower (str): 소문자 이미지 캡션
+            caption_words (list): 캡션 주요 단어 목록 (3글자 초과)
+            page_num (str/int): 페이지 번호
+            
+        Returns:
+            int: 점수 상한
+        """
+        # 일반 이미지 키워드 (+20)
+        max_score = 20
+        # Figure 키워드 ('figure'는 'fig'를 포함)
+        if 'fig' in caption_lower:
+            max_score += 80
+        # 페이지 번호
+        if page_num and str(page_num) != 'Unknown':
+            max_score += 60
+        # 캡션 키워드 (단어마다 +30)
+        max_score += 30 * len(caption_words)
+        return max_score
+
+    def _calculate_image_match_score(self, filename_lower, caption_lower, caption_words, te_variants, page_num, debug=False):
         """
         파일명과 이미지 정보 간의 매칭 점수를 계산
         
         Args:
-            filename (str): 파일명
-            caption (str): 이미지 캡션
-            te_number (str): TE 번호
+            filename_lower (str): 소문자 파일명 (폴더 캐시에 저장된 값)
+            caption_lower (str): 소문자 이미지 캡션
+            caption_words (list): 캡션 주요 단어 목록 (3글자 초과, 호출 측에서 한 번만 생성)
+            te_variants (tuple): 소문자 TE 번호 변형 목록 (호출 측에서 한 번만 생성)
             page_num (str/int): 페이지 번호
+            debug (bool): 매칭 항목별 로그 출력 여부
             
         Returns:
             int: 매칭 점수
         """
         score = 0
-        filename_lower = filename.lower()
-        caption_lower = caption.lower() if caption else ''
         
         # 1. TE 번호 매칭 (최고 우선순위)
-        if te_number:
-            te_variants = [
-                te_number.lower(),
-                te_number.replace('.', '_').lower(),
-                te_number.replace('.', '-').lower(),
-                te_number.replace('te', '').replace('.', '_').lower()
-            ]
-            
-            for te_variant in te_variants:
-                if te_variant in filename_lower:
-                    score += 100
+        for te_variant in te_variants:
+            if te_variant in filename_lower:
+                score += 100
+                if debug:
                     print(f"    TE 번호 매칭: {te_variant} (+100)")
-                    break
+                break
         
         # 2. Figure 키워드 매칭
         figure_keywords = ['figure', 'fig']
         for keyword in figure_keywords:
             if keyword in filename_lower and keyword in caption_lower:
                 score += 80
-                print(f"    Figure 키워드 매칭: {keyword} (+80)")
+                if debug:
+                    print(f"    Figure 키워드 매칭: {keyword} (+80)")
                 break
         
         # 3. 페이지 번호 매칭
@@ -5599,15 +5672,15 @@ class ImageViewerPopup:
             for pattern in page_patterns:
                 if pattern in filename_lower:
                     score += 60
-                    print(f"    페이지 번호 매칭: {pattern} (+60)")
+                    if debug:
+                        print(f"    페이지 번호 매칭: {pattern} (+60)")
                     break
         
-        # 4. 캡션 키워드 매칭
-        if caption:
-            caption_words = caption_lower.split()
-            for word in caption_words:
-                if len(word) > 3 and word in filename_lower:  # 3글자 이상만 매칭
-                    score += 30
+        # 4. 캡션 키워드 매칭 (3글자 초과 단어만)
+        for word in caption_words:
+            if word in filename_lower:
+                score += 30
+                if debug:
                     print(f"    캡션 키워드 매칭: {word} (+30)")
         
         # 5. 일반 이미지 키워드 매칭
@@ -5615,7 +5688,8 @@ class ImageViewerPopup:
         for keyword in image_keywords:
             if keyword in filename_lower:
                 score += 20
-                print(f"    이미지 키워드 매칭: {keyword} (+20)")
+                if debug:
+                    print(f"    이미지 키워드 매칭: {keyword} (+20)")
                 break
         
         return score
@@ -5629,27 +5703,65 @@ class ImageViewerPopup:
         """
         if not hasattr(self, 'original_image') or self.original_image is None:
             return
-            
-        old_zoom = self.zoom_level
         
+        # 휠 한 칸은 줌 격자 한 단계 (확대 1.1배, 축소는 그 역수)
         if event.num == 4 or event.delta > 0:  # 확대
-            self.zoom_level *= 1.1
+            self._zoom_accum += 1
         elif event.num == 5 or event.delta < 0:  # 축소
-            self.zoom_level *= 0.9
+            self._zoom_accum -= 1
+        else:
+            return
         
-        self.zoom_level = max(0.1, min(5.0, self.zoom_level))
+        # 빠르게 이어지는 휠 입력은 모아서 한 프레임에 한 번만 다시 그림
+        if not self._zoom_pending:
+            self._zoom_pending = True
+            self.top.after(_ZOOM_WHEEL_FLUSH_MS, self._flush_zoom)
+    
+    def _flush_zoom(self):
+        """모아 둔 마우스 휠 단계를 한 번에 적용"""
+        accum = self._zoom_accum
+        self._zoom_accum = 0
+        self._zoom_pending = False
+        if not self.original_image or not self.canvas.winfo_exists():
+            return
         
-        if old_zoom != self.zoom_level:
+        new_zoom = _ZOOM_STEP ** _zoom_step(self.zoom_level * _ZOOM_STEP ** accum)
+        
+        if new_zoom != self.zoom_level:
+            self.zoom_level = new_zoom
             self._update_image_with_zoom()
     
     def _update_image_with_zoom(self):
-        """현재 줌 레벨에 맞게 이미지를 업데이트"""
+        """
+        현재 줌 레벨에 맞게 이미지를 업데이트
+        
+        줌 레벨을 _ZOOM_STEP ** n 격자로 맞춘 뒤, 같은 단계의 LANCZOS 결과가 캐시에 있으면 그대로 쓰고
+        없으면 먼저 빠른 BILINEAR로 그린 뒤 확대/축소 조작이 잠시 멈추면 LANCZOS로 다시 그려 캐시에 저장한다.
+        """
         if self.original_image:
+            step = _zoom_step(self.zoom_level)
+            self.zoom_level = _ZOOM_STEP ** step
             orig_width, orig_height = self.original_image.size
             new_width = int(orig_width * self.zoom_level)
             new_height = int(orig_height * self.zoom_level)
-            resized_image = self.original_image.resize((new_width, new_height), Image.LANCZOS)
-            self.photo = ImageTk.PhotoImage(resized_image)
+            size = (new_width, new_height)
+            
+            # 이전 크기에 대해 예약된 고화질 렌더링은 취소
+            if self._hq_render_job is not None:
+                self.top.after_cancel(self._hq_render_job)
+                self._hq_render_job = None
+            
+            cached = self._zoom_cache.get(step)
+            if cached is not None:
+                photo = cached[0]
+                self._zoom_cache.move_to_end(step)
+            else:
+                # reducing_gap: 크게 축소할 때는 reduce(박스 평균)로 먼저 줄인 뒤 리샘플링
+                resized_image = self.original_image.resize(size, Image.BILINEAR, reducing_gap=2.0)
+                photo = ImageTk.PhotoImage(resized_image)
+                self._hq_render_job = self.top.after(_ZOOM_HQ_DELAY_MS, self._render_zoom_high_quality, step, size)
+            
+            self.photo = photo
             self.canvas.itemconfig(self.image_id, image=self.photo)
             self.canvas.config(scrollregion=self.canvas.bbox(tk.ALL))
             info_text = f"이미지 크기: {orig_width}x{orig_height} 픽셀 (표시: {new_width}x{new_height}, 확대/축소: {self.zoom_level:.2f}x)"
@@ -5658,6 +5770,32 @@ class ImageViewerPopup:
             base_title = self.top.title().split(' - ')[0]  # 기본 제목만 유지
             self.top.title(f"{base_title} - {info_text}")
     
+    def _render_zoom_high_quality(self, step, size):
+        """
+        확대/축소 조작이 멈춘 뒤 현재 크기를 LANCZOS로 다시 그리고 캐시에 저장
+        
+        Args:
+            step (int): 줌 격자 단계 (캐시 키)
+            size (tuple): (너비, 높이) 표시 크기
+        """
+        self._hq_render_job = None
+        if not self.original_image or not self.canvas.winfo_exists():
+            return
+        
+        photo = ImageTk.PhotoImage(self.original_image.resize(size, Image.LANCZOS))
+        pixels = size[0] * size[1]
+        self._zoom_cache[step] = (photo, pixels)
+        self._zoom_cache_pixels += pixels
+        
+        # 항목 수/픽셀 수 한도를 넘으면 가장 오래 사용하지 않은 단계부터 제거 (방금 넣은 항목은 유지)
+        while len(self._zoom_cache) > 1 and (len(self._zoom_cache) > _ZOOM_CACHE_SIZE or
+                                             self._zoom_cache_pixels > _ZOOM_CACHE_MAX_PIXELS):
+            _, (_, old_pixels) = self._zoom_cache.popitem(last=False)
+            self._zoom_cache_pixels -= old_pixels
+        
+        self.photo = photo
+        self.canvas.itemconfig(self.image_id, image=self.photo)
+    
     def _create_close_button(self):
         """닫기 버튼 및 확대/축소 버튼 생성"""
         btn_frame = tk.Frame(self.top)
@@ -5,12 +5,22 @@ ISO/IEC 24759 표준 기반 CMVP 시험결과보고서 검증 시스템
 ISO/IEC 24759 국제표준에 따라 자동으로 검증하는 기능을 제공합니다.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional, Dict, Any
+from types import MappingProxyType
+from typing import List, Optional, Dict, Any, Mapping
+import itertools
 import json
 import logging
+import os
+import re
+import sys
+
+
+# TE 번호 형식 (예: TE02.03.01) - 규칙/시험항목 검증에서 반복 사용하므로 한 번만 컴파일
+_TE_NUMBER_RE = re.compile(r'^TE\d{2}\.\d{2}\.\d{2}$')
 
 
 # ============================================================================
@@ -64,7 +74,11 @@ class ComplianceCheckError(ValidationError):
 # 데이터 모델 클래스
 # ============================================================================
 
-@dataclass
+# 대량으로 생성되는 결과/규칙 객체는 __dict__ 대신 슬롯 사용 (dataclass slots 옵션은 Python 3.10+)
+_DATACLASS_OPTIONS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationResult:
     """검증 결과를 담는 데이터 클래스"""
     test_item_name: str
@@ -92,7 +106,7 @@ class ValidationResult:
         return json.dumps(self.to_dict(), ensure_ascii=False, indent=2)
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ComplianceResult:
     """개별 준수 검사 결과를 담는 데이터 클래스"""
     rule_name: str
@@ -114,7 +128,7 @@ class ComplianceResult:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class TestItemData:
     """시험항목 데이터를 담는 데이터 클래스"""
     te_number: str
@@ -140,7 +154,7 @@ class TestItemData:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class ValidationRule:
     """검증 규칙을 정의하는 데이터 클래스"""
     name: str
@@ -232,6 +246,11 @@ class ValidationConfig:
             )
 
 
+# 설정 파일 최상위 및 개별 규칙의 필수 필드
+_REQUIRED_CONFIG_FIELDS = ("version", "iso_standard_version", "rules")
+_REQUIRED_RULE_FIELDS = ("name", "required_metadata", "required_table_fields", "validation_checks")
+
+
 class RuleConfigLoader:
     """검증 규칙 설정 로더 및 파서"""
     
@@ -240,6 +259,7 @@ class RuleConfigLoader:
         self.config_data = None
         self.rules_cache = {}
         self.last_loaded = None
+        self._stat_key = None  # 마지막으로 로드한 설정 파일의 (st_mtime_ns, st_size)
         
     def load_rules(self) -> Dict[str, ValidationRule]:
         """검증 규칙을 로드하고 ValidationRule 객체로 변환"""
@@ -247,16 +267,42 @@ class RuleConfigLoader:
             self.config_data = ValidationConfig.load_from_file(self.config_path)
             self.last_loaded = datetime.now()
             
-            # 설정 유효성 검증
-            self._validate_config_structure()
+            config_data = self.config_data
+            if not isinstance(config_data, dict):
+                raise InvalidRuleConfigError("config_structure", "설정 파일이 올바른 JSON 객체가 아닙니다.")
+            for field in _REQUIRED_CONFIG_FIELDS:
+                if field not in config_data:
+                    raise InvalidRuleConfigError("config_structure", f"필수 필드 '{field}'가 없습니다.")
             
-            # 규칙 객체 생성
+            # 규칙 구조 검증과 규칙 객체 생성을 한 번의 순회로 처리
             rules = {}
-            for te_number, rule_data in self.config_data.get("rules", {}).items():
+            from_dict = ValidationRule.from_dict
+            for te_number, rule_data in config_data["rules"].items():
+                for field in _REQUIRED_RULE_FIELDS:
+                    if field not in rule_data:
+                        raise InvalidRuleConfigError(
+                            te_number, 
+                            f"규칙 '{te_number}'에 필수 필드 '{field}'가 없습니다."
+                        )
+                
+                checks = rule_data["validation_checks"]
+                if not isinstance(checks, list) or len(checks) == 0:
+                    raise InvalidRuleConfigError(
+                        te_number,
+                        f"규칙 '{te_number}'의 validation_checks가 비어있거나 올바르지 않습니다."
+                    )
+                for check in checks:
+                    if not isinstance(check, dict) or "type" not in check or "weight" not in check:
+                        raise InvalidRuleConfigError(
+                            te_number,
+                            f"규칙 '{te_number}'의 validation_check 구조가 올바르지 않습니다."
+                        )
+                
                 rule_data["te_number"] = te_number
-                rules[te_number] = ValidationRule.from_dict(rule_data)
+                rules[te_number] = from_dict(rule_data)
                 
             self.rules_cache = rules
+            self._stat_key = self._get_stat_key()
             logger.info(f"검증 규칙 {len(rules)}개를 성공적으로 로드했습니다.")
             return rules
             
@@ -264,57 +310,17 @@ class RuleConfigLoader:
             logger.error(f"검증 규칙 로드 실패: {str(e)}")
             raise InvalidRuleConfigError("rule_loading", str(e))
     
-    def _validate_config_structure(self):
-        """설정 파일 구조 유효성 검증"""
-        if not isinstance(self.config_data, dict):
-            raise InvalidRuleConfigError("config_structure", "설정 파일이 올바른 JSON 객체가 아닙니다.")
-        
-        required_fields = ["version", "iso_standard_version", "rules"]
-        for field in required_fields:
-            if field not in self.config_data:
-                raise InvalidRuleConfigError("config_structure", f"필수 필드 '{field}'가 없습니다.")
-        
-        # 규칙 구조 검증
-        rules = self.config_data.get("rules", {})
-        for te_number, rule_data in rules.items():
-            self._validate_rule_structure(te_number, rule_data)
-    
-    def _validate_rule_structure(self, te_number: str, rule_data: Dict[str, Any]):
-        """개별 규칙 구조 유효성 검증"""
-        required_fields = ["name", "required_metadata", "required_table_fields", "validation_checks"]
-        for field in required_fields:
-            if field not in rule_data:
-                raise InvalidRuleConfigError(
-                    te_number, 
-                    f"규칙 '{te_number}'에 필수 필드 '{field}'가 없습니다."
-                )
-        
-        # validation_checks 구조 검증
-        checks = rule_data.get("validation_checks", [])
-        if not isinstance(checks, list) or len(checks) == 0:
-            raise InvalidRuleConfigError(
-                te_number,
-                f"규칙 '{te_number}'의 validation_checks가 비어있거나 올바르지 않습니다."
-            )
-        
-        for check in checks:
-            if not isinstance(check, dict) or "type" not in check or "weight" not in check:
-                raise InvalidRuleConfigError(
-                    te_number,
-                    f"규칙 '{te_number}'의 validation_check 구조가 올바르지 않습니다."
-                )
-    
     def get_rule(self, te_number: str) -> Optional[ValidationRule]:
         """특정 TE 번호에 대한 규칙 반환"""
         if not self.rules_cache:
             self.load_rules()
         return self.rules_cache.get(te_number)
     
-    def get_all_rules(self) -> Dict[str, ValidationRule]:
-        """모든 규칙 반환"""
+    def get_all_rules(self) -> Mapping[str, ValidationRule]:
+        """모든 규칙 반환 (복사 없는 읽기 전용 뷰)"""
         if not self.rules_cache:
             self.load_rules()
-        return self.rules_cache.copy()
+        return MappingProxyType(self.rules_cache)
     
     def get_config_info(self) -> Dict[str, Any]:
         """설정 정보 반환"""
@@ -329,31 +335,42 @@ class RuleConfigLoader:
             "last_loaded": self.last_loaded.isoformat() if self.last_loaded else None
         }
     
+    def _get_stat_key(self) -> Optional[tuple]:
+        """설정 파일의 (st_mtime_ns, st_size) 반환 (파일이 없으면 None)"""
+        try:
+            st = os.stat(self.config_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+    
     def reload_if_needed(self) -> bool:
         """필요시 규칙 재로드 (파일 변경 감지)"""
         try:
-            import os
-            if os.path.exists(self.config_path):
-                file_mtime = datetime.fromtimestamp(os.path.getmtime(self.config_path))
-                if not self.last_loaded or file_mtime > self.last_loaded:
-                    logger.info("설정 파일이 변경되어 규칙을 재로드합니다.")
-                    self.load_rules()
-                    return True
+            # stat 한 번으로 마지막 로드 시점의 수정 시각/크기와 비교 (시계 변경과 무관)
+            stat_key = self._get_stat_key()
+            if stat_key is not None and stat_key != self._stat_key:
+                logger.info("설정 파일이 변경되어 규칙을 재로드합니다.")
+                self.load_rules()
+                return True
             return False
         except Exception as e:
             logger.warning(f"파일 변경 감지 실패: {str(e)}")
             return False
 
 
+# 검증 규칙에 허용되는 검사 타입
+_VALID_CHECK_TYPES = frozenset({
+    "metadata_completeness",
+    "table_structure", 
+    "content_accuracy",
+    "required_elements"
+})
+
+
 class RuleValidator:
     """검증 규칙 자체의 유효성을 검증하는 클래스"""
     
-    VALID_CHECK_TYPES = {
-        "metadata_completeness",
-        "table_structure", 
-        "content_accuracy",
-        "required_elements"
-    }
+    VALID_CHECK_TYPES = _VALID_CHECK_TYPES
     
     @classmethod
     def validate_rule(cls, rule: ValidationRule) -> List[str]:
@@ -371,17 +388,19 @@ class RuleValidator:
         if rule.te_number and not cls._is_valid_te_number(rule.te_number):
             errors.append(f"TE 번호 형식이 올바르지 않습니다: {rule.te_number}")
         
-        # validation_checks 검증
+        # validation_checks 검증 (반복 중 쓰는 속성/메서드는 지역 변수로 한 번만 조회)
+        valid_types = cls.VALID_CHECK_TYPES
+        add_error = errors.append
         total_weight = 0
         for check in rule.validation_checks:
             check_type = check.get("type")
             weight = check.get("weight", 0)
             
-            if check_type not in cls.VALID_CHECK_TYPES:
-                errors.append(f"알 수 없는 검증 타입: {check_type}")
+            if check_type not in valid_types:
+                add_error(f"알 수 없는 검증 타입: {check_type}")
             
             if not isinstance(weight, (int, float)) or weight <= 0:
-                errors.append(f"검증 가중치가 올바르지 않습니다: {weight}")
+                add_error(f"검증 가중치가 올바르지 않습니다: {weight}")
             
             total_weight += weight
         
@@ -394,10 +413,8 @@ class RuleValidator:
     @staticmethod
     def _is_valid_te_number(te_number: str) -> bool:
         """TE 번호 형식 유효성 검증"""
-        import re
         # TE02.03.01 형식 검증
-        pattern = r'^TE\d{2}\.\d{2}\.\d{2}$'
-        return bool(re.match(pattern, te_number))
+        return _TE_NUMBER_RE.match(te_number) is not None
 
 
 # ============================================================================
@@ -414,7 +431,7 @@ class ValidationRuleEngine:
         self.cache_ttl = ValidationConfig.CACHE_TTL
         self.last_cache_update = None
         self.rule_validator = RuleValidator()
-        self.change_history = []  # 규칙 변경 이력
+        self.change_history = deque(maxlen=100)  # 규칙 변경 이력 (최근 100개만 유지)
         
     def get_rules_for_test_item(self, te_number: str) -> Optional[ValidationRule]:
         """특정 시험항목에 적용할 검증 규칙 반환"""
@@ -442,12 +459,16 @@ class ValidationRuleEngine:
             logger.error(f"규칙 조회 중 오류 발생: {str(e)}")
             raise
     
-    def get_all_rules(self) -> Dict[str, ValidationRule]:
-        """모든 검증 규칙 반환"""
+    def get_all_rules(self) -> Mapping[str, ValidationRule]:
+        """모든 검증 규칙 반환 (복사 없는 읽기 전용 뷰)
+
+        Returns:
+            규칙 캐시에 대한 MappingProxyType 뷰. 수정이 필요하면 dict()로 복사해서 사용
+        """
         try:
             if self._should_reload_cache():
                 self._reload_rules()
-            return self.rules_cache.copy()
+            return MappingProxyType(self.rules_cache)
         except Exception as e:
             logger.error(f"전체 규칙 조회 중 오류 발생: {str(e)}")
             raise
@@ -511,58 +532,52 @@ class ValidationRuleEngine:
     def _track_rule_changes(self, old_rules: Dict[str, ValidationRule], new_rules: Dict[str, ValidationRule]):
         """규칙 변경 사항 추적"""
         timestamp = datetime.now()
-        changes = []
         
         # 새로 추가된 규칙
-        for te_number in new_rules:
-            if te_number not in old_rules:
+        changes = [
+            {
+                "type": "added",
+                "te_number": te_number,
+                "rule_name": new_rule.name,
+                "timestamp": timestamp
+            }
+            for te_number, new_rule in new_rules.items() if te_number not in old_rules
+        ]
+        
+        # 삭제된 규칙과 수정된 규칙은 기존 규칙을 한 번만 순회하며 구분
+        modified = []
+        for te_number, old_rule in old_rules.items():
+            new_rule = new_rules.get(te_number)
+            if new_rule is None:
                 changes.append({
-                    "type": "added",
+                    "type": "removed", 
                     "te_number": te_number,
-                    "rule_name": new_rules[te_number].name,
+                    "rule_name": old_rule.name,
                     "timestamp": timestamp
                 })
-        
-        # 삭제된 규칙
-        for te_number in old_rules:
-            if te_number not in new_rules:
-                changes.append({
-                    "type": "removed", 
+            elif new_rule is not old_rule and new_rule != old_rule:
+                # dataclass 비교는 모든 필드를 순서대로 비교하고 첫 차이에서 멈춤
+                modified.append({
+                    "type": "modified",
                     "te_number": te_number,
-                    "rule_name": old_rules[te_number].name,
+                    "rule_name": new_rule.name,
                     "timestamp": timestamp
                 })
-        
-        # 수정된 규칙 (간단한 비교)
-        for te_number in old_rules:
-            if te_number in new_rules:
-                old_rule = old_rules[te_number]
-                new_rule = new_rules[te_number]
-                
-                if (old_rule.name != new_rule.name or 
-                    old_rule.required_metadata != new_rule.required_metadata or
-                    old_rule.required_table_fields != new_rule.required_table_fields or
-                    old_rule.validation_checks != new_rule.validation_checks):
-                    
-                    changes.append({
-                        "type": "modified",
-                        "te_number": te_number,
-                        "rule_name": new_rule.name,
-                        "timestamp": timestamp
-                    })
+        changes.extend(modified)
         
         # 변경 이력에 추가
         if changes:
             self.change_history.extend(changes)
-            # 이력 크기 제한 (최근 100개만 유지)
-            if len(self.change_history) > 100:
-                self.change_history = self.change_history[-100:]
             
             logger.info(f"규칙 변경 사항 {len(changes)}개를 감지했습니다.")
     
     def get_change_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """규칙 변경 이력 반환"""
-        return self.change_history[-limit:] if limit > 0 else self.change_history
+        history = self.change_history
+        if limit <= 0:
+            return list(history)
+        # deque는 음수 슬라이스를 지원하지 않으므로 islice로 최근 limit개만 취함
+        return list(itertools.islice(history, max(0, len(history) - limit), None))
     
     def get_engine_status(self) -> Dict[str, Any]:
         """엔진 상태 정보 반환"""
@@ -1979,9 +1994,7 @@ class TestItemExtractor:
         if not te_number or not isinstance(te_number, str):
             return False
         
-        import re
-        pattern = r"^TE\d{2}\.\d{2}\.\d{2}$"
-        return bool(re.match(pattern, te_number.strip()))# =====
+        return _TE_NUMBER_RE.match(te_number.strip()) is not None# =====
 =======================================================================
 # 검증 결과 포맷터
 # ============================================================================